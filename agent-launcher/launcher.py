@@ -4,7 +4,11 @@ A system tray application for managing the Boz Ripper Agent.
 Single instance only - prevents multiple launchers and agents.
 """
 
+import hashlib
 import os
+import select
+import shutil
+import signal
 import sys
 import subprocess
 import threading
@@ -13,23 +17,24 @@ import webbrowser
 import tempfile
 import ctypes
 from pathlib import Path
-from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
-import psutil
-import pystray
-from PIL import Image, ImageDraw
-from pystray import MenuItem as Item
+if TYPE_CHECKING:
+    from PIL import Image
 
-# Try to import git, but handle gracefully if not available
-try:
-    import git
-    GIT_AVAILABLE = True
-except ImportError:
-    GIT_AVAILABLE = False
+# Heavy dependencies (psutil, pystray, PIL) are imported where they are first
+# used, so the launcher doesn't pay for them on paths that never need them.
+# Updates shell out to the git executable rather than importing GitPython.
+GIT_AVAILABLE = shutil.which("git") is not None
 
 # Configuration
 DASHBOARD_URL = "http://10.0.0.60:5000"
-CHECK_INTERVAL = 5  # seconds between health checks
+# Polling fallback only: seconds between health checks, backing off while nothing changes
+CHECK_INTERVALS = (1, 5, 15)
+ALIVE_CHECK_TTL = 0.25  # seconds an is_agent_running() answer is reused
+AGENT_SCAN_TTL = 2.0  # seconds a process-table scan for agents is reused
+STARTUP_GRACE_PERIOD = 2  # seconds the agent must stay up to count as started
+UPDATE_WAIT_TIMEOUT = 60  # max seconds auto-start waits for the startup update check
 LOCK_FILE_NAME = "boz_ripper_launcher.lock"
 AGENT_PROCESS_NAME = "boz_agent"
 
@@ -50,7 +55,23 @@ AGENT_DIR = REPO_DIR / "agent"
 LOG_FILE = LAUNCHER_DIR / "agent.log"
 LOG_MAX_SIZE_MB = 10  # Rotate when log exceeds this size
 LOG_BACKUP_COUNT = 2  # Keep this many backup files
+LOG_FLUSH_INTERVAL = 1  # seconds before buffered launcher log lines are flushed
+LOG_BUFFER_SIZE = 8192  # bytes of pending launcher log lines that force an early flush
+# Set BOZ_LAUNCHER_LOG_UNBUFFERED=1 to write log lines straight through (debugging)
+LOG_UNBUFFERED = os.environ.get("BOZ_LAUNCHER_LOG_UNBUFFERED") == "1"
 LOCK_FILE = Path(tempfile.gettempdir()) / LOCK_FILE_NAME
+REQUIREMENTS_HASH_FILE = LAUNCHER_DIR / ".requirements_hash"  # Hash of last installed requirements.txt
+LAST_UPDATE_CHECK_FILE = LAUNCHER_DIR / ".last_update_check"  # Touched after each completed update check
+UPDATE_CHECK_MIN_INTERVAL = 600  # Startup skips the update check if one completed this recently (seconds)
+
+# Event-driven child exit notification needs pidfd_open (Linux 5.3+, Python 3.9+).
+# On Windows we block on the process handle instead.
+HAS_PIDFD = hasattr(os, "pidfd_open")
+USE_POLLING_MONITOR = sys.platform != "win32" and not HAS_PIDFD
+
+# On POSIX the agent leads its own process group so one killpg() reaches the
+# whole tree. Windows has no equivalent signal, so children are walked instead.
+USE_PROCESS_GROUP = sys.platform != "win32"
 
 
 def find_python_executable() -> str:
@@ -60,12 +81,14 @@ def find_python_executable() -> str:
         return sys.executable
 
     # Running as frozen exe, need to find Python
-    # Try common locations
+    # Check PATH first (shutil.which searches in-process, no 'where' subprocess)
+    for command in ("python", "python3"):
+        python_path = shutil.which(command)
+        if python_path:
+            return python_path
+
+    # Common Windows install locations
     possible_paths = [
-        # Check PATH first
-        "python",
-        "python3",
-        # Common Windows install locations
         Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Python" / "Python313" / "python.exe",
         Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Python" / "Python312" / "python.exe",
         Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Python" / "Python311" / "python.exe",
@@ -76,37 +99,8 @@ def find_python_executable() -> str:
         Path("C:/Python310/python.exe"),
     ]
 
-    # Try to find python via 'where' command on Windows
-    try:
-        result = subprocess.run(
-            ["where", "python"],
-            capture_output=True,
-            text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-        )
-        if result.returncode == 0:
-            python_path = result.stdout.strip().split('\n')[0]
-            if python_path and Path(python_path).exists():
-                return python_path
-    except Exception:
-        pass
-
-    # Check each possible path
     for path in possible_paths:
-        if isinstance(path, str):
-            # It's a command name, try to find it
-            try:
-                result = subprocess.run(
-                    ["where", path],
-                    capture_output=True,
-                    text=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-                )
-                if result.returncode == 0:
-                    return result.stdout.strip().split('\n')[0]
-            except Exception:
-                pass
-        elif path.exists():
+        if path.exists():
             return str(path)
 
     # Fallback - hope python is in PATH
@@ -117,50 +111,64 @@ PYTHON_EXE = find_python_executable()
 
 
 class SingleInstanceChecker:
-    """Ensures only one instance of the launcher runs at a time."""
+    """Ensures only one instance of the launcher runs at a time.
+
+    Holds an OS advisory lock on LOCK_FILE for the launcher's lifetime. The
+    OS drops the lock when the process exits, even after a crash, so a
+    leftover lock file never blocks the next launch.
+    """
 
     def __init__(self):
-        self.lock_file = None
+        self.lock_fd = None
         self.locked = False
 
     def try_acquire(self) -> bool:
         """Try to acquire the single instance lock. Returns True if successful."""
         try:
-            # Check if lock file exists and if the process is still running
-            if LOCK_FILE.exists():
-                try:
-                    with open(LOCK_FILE, "r") as f:
-                        old_pid = int(f.read().strip())
+            self.lock_fd = os.open(LOCK_FILE, os.O_CREAT | os.O_RDWR)
+        except OSError:
+            return False
 
-                    # Check if the old process is still running
-                    if psutil.pid_exists(old_pid):
-                        try:
-                            proc = psutil.Process(old_pid)
-                            # Check if it's actually our launcher
-                            if "python" in proc.name().lower() or "bozripperagent" in proc.name().lower():
-                                return False  # Another instance is running
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass  # Process doesn't exist or can't access, OK to proceed
-                except (ValueError, IOError):
-                    pass  # Invalid lock file, OK to overwrite
-
-            # Create/update lock file with our PID
-            with open(LOCK_FILE, "w") as f:
-                f.write(str(os.getpid()))
-
-            self.locked = True
-            return True
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+                msvcrt.locking(self.lock_fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(self.lock_fd)
+            self.lock_fd = None
+            return False  # Another instance holds the lock
+
+        # Record our PID for diagnostics only; the lock itself is what matters
+        try:
+            os.ftruncate(self.lock_fd, 0)
+            os.write(self.lock_fd, str(os.getpid()).encode())
+            os.lseek(self.lock_fd, 0, os.SEEK_SET)
+        except OSError:
+            pass
 
-        except Exception:
-            return False
+        self.locked = True
+        return True
 
     def release(self):
         """Release the lock."""
         if self.locked:
             try:
-                LOCK_FILE.unlink(missing_ok=True)
-            except Exception:
+                if sys.platform == "win32":
+                    import msvcrt
+                    msvcrt.locking(self.lock_fd, msvcrt.LK_UNLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+            except OSError:
+                pass
+            try:
+                os.close(self.lock_fd)
+            except OSError:
                 pass
+            self.lock_fd = None
             self.locked = False
 
 
@@ -198,24 +206,130 @@ def rotate_logs():
         print(f"Log rotation error: {e}")
 
 
-def find_existing_agent_processes():
-    """Find any existing boz_agent Python processes."""
-    agents = []
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+def startup_update_check_due() -> bool:
+    """Return True unless an update check completed within UPDATE_CHECK_MIN_INTERVAL."""
+    try:
+        last_check = LAST_UPDATE_CHECK_FILE.stat().st_mtime
+    except OSError:
+        return True
+    return time.time() - last_check >= UPDATE_CHECK_MIN_INTERVAL
+
+
+def get_local_head_sha() -> Optional[str]:
+    """Resolve the local HEAD commit SHA straight from .git (no GitPython)."""
+    git_dir = REPO_DIR / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head  # Detached HEAD holds the SHA itself
+
+        ref = head[len("ref: "):]
+        ref_file = git_dir / ref
+        if ref_file.exists():
+            return ref_file.read_text().strip()
+
+        # Ref has been packed - find it in packed-refs
+        with open(git_dir / "packed-refs") as f:
+            for line in f:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+
+    return None
+
+
+def run_git(*args: str, timeout: int = 30) -> subprocess.CompletedProcess:
+    """Run a git command in REPO_DIR and capture its output."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=str(REPO_DIR),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+    )
+
+
+def get_remote_head_sha() -> Optional[str]:
+    """Ask origin for its main commit SHA with a single ls-remote round trip."""
+    try:
+        result = run_git("ls-remote", "origin", "refs/heads/main")
+    except Exception:
+        return None
+
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout.split()[0]
+
+
+_icon_font = None
+
+
+def get_icon_font():
+    """Load the tray icon font once and reuse it for every icon."""
+    global _icon_font
+    if _icon_font is None:
+        from PIL import ImageFont
+
         try:
-            cmdline = proc.info.get('cmdline') or []
-            cmdline_str = ' '.join(cmdline).lower()
+            # Try to use a system font
+            _icon_font = ImageFont.truetype("arial.ttf", 32)
+        except Exception:
+            _icon_font = ImageFont.load_default()
+    return _icon_font
+
+
+_agent_scan_lock = threading.Lock()
+_agent_scan_cache = (0.0, [])  # (monotonic time of scan, agent PIDs)
+
+
+def find_existing_agent_processes(refresh: bool = False):
+    """Find any existing boz_agent Python processes.
 
-            # Check if this is a boz_agent process
-            if 'boz_agent' in cmdline_str and 'python' in proc.info.get('name', '').lower():
-                agents.append(proc.info['pid'])
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-    return agents
+    The result of a scan is reused for AGENT_SCAN_TTL seconds so back-to-back
+    callers share one pass over the process table. Pass refresh=True to force
+    a fresh scan.
+    """
+    global _agent_scan_cache
+    import psutil
+
+    with _agent_scan_lock:
+        scanned_at, cached = _agent_scan_cache
+        if not refresh and time.monotonic() - scanned_at < AGENT_SCAN_TTL:
+            return list(cached)
+
+        if refresh:
+            psutil.process_iter.cache_clear()
+
+        agents = []
+        # Only the name is fetched for every process; reading a command line
+        # means opening the process (and its PEB on Windows), so that is left
+        # to the few python processes that survive the name filter
+        for proc in psutil.process_iter(['name']):
+            try:
+                name = proc.info['name']  # None if access was denied
+                if not name or 'python' not in name.lower():
+                    continue
+
+                # Check if this is a boz_agent process (`-m boz_agent...`)
+                for arg in proc.cmdline():
+                    if 'boz_agent' in arg:
+                        agents.append(proc.pid)
+                        break
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+        _agent_scan_cache = (time.monotonic(), agents)
+        return list(agents)
 
 
 def kill_existing_agents():
     """Kill any existing boz_agent processes."""
+    global _agent_scan_cache
+    import psutil
+
     agents = find_existing_agent_processes()
     for pid in agents:
         try:
@@ -229,9 +343,47 @@ def kill_existing_agents():
                 pass
         except Exception:
             pass
+
+    # The process table just changed, so the cached scan is stale
+    with _agent_scan_lock:
+        _agent_scan_cache = (0.0, [])
+
     return len(agents)
 
 
+def get_descendant_processes(root_pid: int) -> list:
+    """Return every descendant of root_pid from a single process table scan.
+
+    Process.children(recursive=True) rescans the table for each level of the
+    tree; here the PPID map is built once and walked locally. A child must be
+    created after its parent, which screens out stale PPIDs left behind by
+    recycled PIDs on Windows.
+    """
+    import psutil
+
+    tree = {}
+    root_created = None
+    for proc in psutil.process_iter(['ppid', 'create_time']):
+        if proc.pid == root_pid:
+            root_created = proc.info['create_time']
+        ppid = proc.info['ppid']
+        if ppid is not None:
+            tree.setdefault(ppid, []).append(proc)
+
+    descendants = []
+    stack = [(root_pid, root_created)]
+    while stack:
+        pid, created = stack.pop()
+        for child in tree.get(pid, ()):
+            child_created = child.info['create_time']
+            if child.pid == pid or (created and child_created and child_created < created):
+                continue
+            descendants.append(child)
+            stack.append((child.pid, child_created))
+
+    return descendants
+
+
 class AgentStatus:
     """Agent status enumeration."""
     STOPPED = "stopped"
@@ -240,6 +392,24 @@ class AgentStatus:
     STARTING = "starting"
 
 
+# Per-status tray presentation, built once instead of on every update
+_COLOR_BY_STATUS = {
+    AgentStatus.RUNNING: "green",
+    AgentStatus.STOPPED: "red",
+    AgentStatus.UPDATING: "yellow",
+    AgentStatus.STARTING: "blue",
+}
+_TITLE_BY_STATUS = {
+    status: f"Boz Ripper Agent - {status.capitalize()}" for status in _COLOR_BY_STATUS
+}
+_MENU_TEXT_BY_STATUS = {
+    AgentStatus.RUNNING: "Status: Running",
+    AgentStatus.STOPPED: "Status: Stopped",
+    AgentStatus.UPDATING: "Status: Updating...",
+    AgentStatus.STARTING: "Status: Starting...",
+}
+
+
 class BozRipperLauncher:
     """System tray launcher for Boz Ripper Agent."""
 
@@ -249,14 +419,47 @@ class BozRipperLauncher:
         self.icon = None
         self.monitor_thread = None
         self.running = True
-        self.log_file_handle = None
+        self.log_file_handle = None  # agent.log, shared by log() and the agent's stdout
         self.agent_pid = None  # Track the agent PID we started
+        self._psutil_handle = None  # psutil.Process for agent_pid, built on first need
+
+        # Launcher log lines are buffered here and written through log_file_handle
+        self._log_buffer = bytearray()
+        self._log_lock = threading.Lock()
+        self._log_flush_timer = None
+        self._log_ts_cache = (0, b"")  # (epoch second, encoded "[timestamp] " prefix)
+
+        # (process, monotonic time, alive) from the last is_agent_running() probe
+        self._last_alive_check = (None, 0.0, False)
+
+        # Set once the startup update check has finished
+        self._update_done = threading.Event()
+        # Set whenever a new agent process is up, so the monitor can arm on it
+        self._agent_started = threading.Event()
+        # Set to make the polling monitor (fallback only) re-check right away
+        self._wake = threading.Event()
+        # Self-pipe used to wake the monitor's poll() on shutdown
+        self._wakeup_r, self._wakeup_w = os.pipe() if HAS_PIDFD else (None, None)
 
         # Ensure log directory exists
         LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    def create_icon_image(self, color: str) -> Image.Image:
+        # Agent environment is built once rather than copied on every start
+        self._agent_env = {**os.environ, "PYTHONPATH": str(AGENT_DIR / "src")}
+
+        # There are only four possible icons - render them once up front
+        self._icon_cache = {
+            color: self.create_icon_image(color)
+            for color in ("green", "red", "yellow", "blue")
+        }
+        # Last color/title pushed to the tray, so unchanged updates can be skipped
+        self._last_color = None
+        self._last_title = None
+
+    def create_icon_image(self, color: str) -> "Image.Image":
         """Create a simple colored circle icon."""
+        from PIL import Image, ImageDraw
+
         size = 64
         image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(image)
@@ -280,12 +483,7 @@ class BozRipperLauncher:
         )
 
         # Draw "B" letter in center
-        try:
-            from PIL import ImageFont
-            # Try to use a system font
-            font = ImageFont.truetype("arial.ttf", 32)
-        except:
-            font = ImageFont.load_default()
+        font = get_icon_font()
 
         # Center the text
         text = "B"
@@ -303,18 +501,22 @@ class BozRipperLauncher:
         if not self.icon:
             return
 
-        color_map = {
-            AgentStatus.RUNNING: "green",
-            AgentStatus.STOPPED: "red",
-            AgentStatus.UPDATING: "yellow",
-            AgentStatus.STARTING: "blue",
-        }
-        color = color_map.get(self.status, "red")
-        self.icon.icon = self.create_icon_image(color)
-        self.icon.title = f"Boz Ripper Agent - {self.status.capitalize()}"
+        color = _COLOR_BY_STATUS.get(self.status, "red")
+        title = _TITLE_BY_STATUS.get(self.status, "Boz Ripper Agent")
+
+        # Each assignment is a native tray update, so skip ones that change nothing
+        if color != self._last_color:
+            self.icon.icon = self._icon_cache[color]
+            self._last_color = color
+        if title != self._last_title:
+            self.icon.title = title
+            self._last_title = title
 
     def notify(self, title: str, message: str):
         """Show a Windows notification."""
+        # Anything worth a notification is worth having on disk right away
+        self.flush_log()
+
         if self.icon:
             try:
                 self.icon.notify(message, title)
@@ -322,42 +524,89 @@ class BozRipperLauncher:
                 self.log(f"Notification error: {e}")
 
     def log(self, message: str):
-        """Log a message to the log file."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] {message}\n"
+        """Log a message to the log file.
+
+        Lines are buffered and flushed within LOG_FLUSH_INTERVAL seconds
+        instead of reopening the file for every message.
+        """
+        with self._log_lock:
+            # The encoded timestamp prefix only changes once per second
+            now = int(time.time())
+            if now != self._log_ts_cache[0]:
+                prefix = time.strftime("[%Y-%m-%d %H:%M:%S] ", time.localtime(now))
+                self._log_ts_cache = (now, prefix.encode("utf-8"))
+
+            log_line = bytearray(self._log_ts_cache[1])
+            log_line += message.encode("utf-8")
+            log_line += b"\n"
+
+            self._log_buffer += log_line
+            if LOG_UNBUFFERED or len(self._log_buffer) >= LOG_BUFFER_SIZE:
+                self._write_log_buffer()
+            elif self._log_flush_timer is None:
+                self._log_flush_timer = threading.Timer(LOG_FLUSH_INTERVAL, self.flush_log)
+                self._log_flush_timer.daemon = True
+                self._log_flush_timer.start()
+
+        # No console under pythonw, so skip the decode entirely
+        if sys.stdout is not None:
+            print(log_line.decode("utf-8"), end="")
+
+    def flush_log(self, close: bool = False):
+        """Flush buffered log lines to disk, optionally closing the handle."""
+        with self._log_lock:
+            if self._log_flush_timer is not None:
+                self._log_flush_timer.cancel()
+                self._log_flush_timer = None
+
+            self._write_log_buffer()
+
+            if close and self.log_file_handle is not None:
+                try:
+                    self.log_file_handle.close()
+                except Exception:
+                    pass
+                self.log_file_handle = None
+
+    def _get_log_handle(self):
+        """Return the shared agent.log handle, opening it on first use.
+
+        Must be called with self._log_lock held. The handle is unbuffered
+        and stays open across agent restarts until exit_app closes it.
+        """
+        if self.log_file_handle is None:
+            self.log_file_handle = open(LOG_FILE, "ab", buffering=0)
+        return self.log_file_handle
 
+    def _write_log_buffer(self):
+        """Write pending log lines in one call. Caller holds self._log_lock."""
+        if not self._log_buffer:
+            return
         try:
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(log_line)
+            self._get_log_handle().write(self._log_buffer)
         except Exception:
             pass
-
-        print(log_line, end="")
+        self._log_buffer.clear()
 
     def is_agent_running(self) -> bool:
-        """Check if the agent process is still running."""
-        # First check our tracked process
-        if self.agent_process is not None:
-            poll = self.agent_process.poll()
-            if poll is None:
-                # Process is still running
-                try:
-                    proc = psutil.Process(self.agent_process.pid)
-                    if proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE:
-                        return True
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+        """Check if the agent process is still running.
+
+        Popen.poll() returns None only while the child is alive, so no extra
+        process probe is needed. The answer is reused for ALIVE_CHECK_TTL
+        seconds so rapid menu redraws share a single check.
+        """
+        process = self.agent_process
+        if process is None:
+            return False
 
-        # Also check by PID if we have one
-        if self.agent_pid:
-            try:
-                proc = psutil.Process(self.agent_pid)
-                if proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE:
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        now = time.monotonic()
+        cached_process, checked_at, alive = self._last_alive_check
+        if cached_process is process and now - checked_at < ALIVE_CHECK_TTL:
+            return alive
 
-        return False
+        alive = process.poll() is None
+        self._last_alive_check = (process, now, alive)
+        return alive
 
     def start_agent(self, icon=None, item=None):
         """Start the Boz Ripper Agent."""
@@ -385,52 +634,84 @@ class BozRipperLauncher:
                 self.update_icon()
                 return
 
-            # Close any existing log file handle
-            if self.log_file_handle:
-                try:
-                    self.log_file_handle.close()
-                except:
-                    pass
+            process = self._spawn_agent()
 
-            # Open log file for agent output
-            self.log_file_handle = open(LOG_FILE, "a", encoding="utf-8")
-
-            # Set up environment with PYTHONPATH pointing to agent/src
-            env = os.environ.copy()
-            agent_src = AGENT_DIR / "src"
-            env["PYTHONPATH"] = str(agent_src)
-
-            # Start the agent process
-            self.log(f"Using Python: {PYTHON_EXE}")
-            self.agent_process = subprocess.Popen(
-                [PYTHON_EXE, "-m", "boz_agent", "run"],
-                cwd=str(AGENT_DIR),
-                env=env,
-                stdout=self.log_file_handle,
-                stderr=subprocess.STDOUT,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-            )
+        except Exception as e:
+            self.status = AgentStatus.STOPPED
+            self.log(f"Error starting agent: {e}")
+            self.notify("Error", f"Failed to start agent: {e}")
+            self.update_icon()
+            return
 
-            self.agent_pid = self.agent_process.pid
+        # Settle STARTING off the tray thread so the menu callback returns now
+        threading.Thread(target=self._finalize_start, args=(process,), daemon=True).start()
+
+    def _spawn_agent(self) -> subprocess.Popen:
+        """Launch the agent process and start tracking it."""
+        # Start the agent process
+        self.log(f"Using Python: {PYTHON_EXE}")
+
+        # The agent writes straight into the launcher's own log handle; flush
+        # first so our pending lines land ahead of its output
+        with self._log_lock:
+            self._write_log_buffer()
+            log_handle = self._get_log_handle()
+
+        self.agent_process = subprocess.Popen(
+            [PYTHON_EXE, "-m", "boz_agent", "run"],
+            cwd=str(AGENT_DIR),
+            env=self._agent_env,
+            stdout=log_handle,
+            stderr=subprocess.STDOUT,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+            start_new_session=USE_PROCESS_GROUP,
+        )
 
-            # Wait a moment and check if it started successfully
-            time.sleep(2)
+        self.agent_pid = self.agent_process.pid
+        # A new agent may reuse the old PID; never signal it through a stale handle
+        self._psutil_handle = None
+        return self.agent_process
 
-            if self.is_agent_running():
-                self.status = AgentStatus.RUNNING
-                self.log(f"Agent started with PID {self.agent_pid}")
-                self.notify("Agent Started", "Boz Ripper Agent is now running.")
-            else:
-                self.status = AgentStatus.STOPPED
-                self.log("Agent failed to start")
-                self.notify("Start Failed", "Agent failed to start. Check logs for details.")
+    def _finalize_start(self, process: subprocess.Popen):
+        """Mark the agent RUNNING if it survives the startup window.
 
-        except Exception as e:
+        Waits on the process itself, so an early crash is reported as soon
+        as it happens rather than after a fixed sleep.
+        """
+        try:
+            process.wait(timeout=STARTUP_GRACE_PERIOD)
+            exited = True
+        except subprocess.TimeoutExpired:
+            exited = False
+
+        if process is not self.agent_process:
+            return  # Stopped or replaced while starting
+
+        if not exited:
+            self.status = AgentStatus.RUNNING
+            self.log(f"Agent started with PID {self.agent_pid}")
+            self.notify("Agent Started", "Boz Ripper Agent is now running.")
+            self._agent_started.set()
+            if USE_POLLING_MONITOR:
+                threading.Thread(target=self._wake_on_exit, args=(process,), daemon=True).start()
+        else:
             self.status = AgentStatus.STOPPED
-            self.log(f"Error starting agent: {e}")
-            self.notify("Error", f"Failed to start agent: {e}")
+            self.log("Agent failed to start")
+            self.notify("Start Failed", "Agent failed to start. Check logs for details.")
+
+        self._wake.set()
 
         self.update_icon()
+        if self.icon:
+            self.icon.update_menu()
+
+    def _get_psutil_handle(self, pid: int):
+        """Return a psutil.Process for the agent, reusing it while the PID is the same."""
+        import psutil
+
+        if self._psutil_handle is None or self._psutil_handle.pid != pid:
+            self._psutil_handle = psutil.Process(pid)
+        return self._psutil_handle
 
     def stop_agent(self, icon=None, item=None):
         """Stop the Boz Ripper Agent."""
@@ -448,22 +729,33 @@ class BozRipperLauncher:
 
         self.log("Stopping agent...")
 
+        import psutil
+
+        detached = self.agent_process
         try:
-            pid_to_kill = self.agent_pid or (self.agent_process.pid if self.agent_process else None)
+            pid_to_kill = self.agent_pid or (detached.pid if detached else None)
 
-            if pid_to_kill:
-                process = psutil.Process(pid_to_kill)
+            # Detach before terminating so the monitor sees an intentional exit
+            self.agent_process = None
 
-                # Terminate child processes first
-                children = process.children(recursive=True)
-                for child in children:
-                    try:
-                        child.terminate()
-                    except psutil.NoSuchProcess:
-                        pass
+            if pid_to_kill:
+                process = self._get_psutil_handle(pid_to_kill)
+                children = []
+
+                if USE_PROCESS_GROUP:
+                    # Signal the agent and all its children at once
+                    os.killpg(pid_to_kill, signal.SIGTERM)
+                else:
+                    # Terminate child processes first
+                    children = get_descendant_processes(pid_to_kill)
+                    for child in children:
+                        try:
+                            child.terminate()
+                        except psutil.NoSuchProcess:
+                            pass
 
-                # Terminate main process
-                process.terminate()
+                    # Terminate main process
+                    process.terminate()
 
                 # Wait for graceful shutdown
                 try:
@@ -471,12 +763,15 @@ class BozRipperLauncher:
                 except psutil.TimeoutExpired:
                     # Force kill if still running
                     self.log("Agent not responding, forcing kill...")
-                    process.kill()
-                    for child in children:
-                        try:
-                            child.kill()
-                        except psutil.NoSuchProcess:
-                            pass
+                    if USE_PROCESS_GROUP:
+                        os.killpg(pid_to_kill, signal.SIGKILL)
+                    else:
+                        process.kill()
+                        for child in children:
+                            try:
+                                child.kill()
+                            except psutil.NoSuchProcess:
+                                pass
 
             self.agent_process = None
             self.agent_pid = None
@@ -484,24 +779,20 @@ class BozRipperLauncher:
             self.log("Agent stopped")
             self.notify("Agent Stopped", "Boz Ripper Agent has been stopped.")
 
-        except psutil.NoSuchProcess:
+        except (psutil.NoSuchProcess, ProcessLookupError):
             self.log("Agent process already terminated")
             self.agent_process = None
             self.agent_pid = None
             self.status = AgentStatus.STOPPED
         except Exception as e:
+            # The agent may still be running (e.g. access denied), so keep
+            # tracking it rather than reporting it gone
+            self.agent_process = detached
             self.log(f"Error stopping agent: {e}")
             self.notify("Error", f"Failed to stop agent: {e}")
 
-        # Close log file handle
-        if self.log_file_handle:
-            try:
-                self.log_file_handle.close()
-            except:
-                pass
-            self.log_file_handle = None
-
         self.update_icon()
+        self._wake.set()
 
     def restart_agent(self, icon=None, item=None):
         """Restart the Boz Ripper Agent."""
@@ -513,8 +804,16 @@ class BozRipperLauncher:
 
     def check_for_updates(self, icon=None, item=None):
         """Check for updates and apply if available."""
+        try:
+            self._check_and_apply_updates()
+        finally:
+            # Lets the startup auto-start proceed as soon as we're done
+            self._update_done.set()
+
+    def _check_and_apply_updates(self):
+        """Fetch, pull and reinstall if the remote has moved ahead."""
         if not GIT_AVAILABLE:
-            self.notify("Git Not Available", "GitPython is not installed. Cannot check for updates.")
+            self.notify("Git Not Available", "Git is not installed. Cannot check for updates.")
             return
 
         self.log("Checking for updates...")
@@ -525,38 +824,40 @@ class BozRipperLauncher:
         self.update_icon()
 
         try:
-            repo = git.Repo(REPO_DIR)
-
-            # Fetch latest changes
-            origin = repo.remotes.origin
-            origin.fetch()
+            # Compare SHAs without fetching anything
+            remote_sha = get_remote_head_sha()
+            if remote_sha is None:
+                raise RuntimeError("could not read origin/main")
 
-            # Check if we're behind
-            local_commit = repo.head.commit
-            remote_commit = origin.refs.main.commit
-
-            if local_commit == remote_commit:
+            local_sha = get_local_head_sha()
+            if remote_sha == local_sha:
                 self.log("Already up to date")
+                self._record_update_check()
                 self.status = previous_status
                 self.update_icon()
                 return
 
             # Pull updates
             self.log("Updates found, pulling...")
-            origin.pull()
+            result = run_git("pull", "--ff-only", "origin", "main", timeout=300)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip() or "git pull failed")
+
+            if get_local_head_sha() == local_sha:
+                # Local branch is ahead of origin/main - nothing was pulled
+                self.log("Already up to date")
+                self._record_update_check()
+                self.status = previous_status
+                self.update_icon()
+                return
 
-            # Install requirements
-            self.log("Installing updated requirements...")
+            # Install requirements (only when requirements.txt actually changed)
             requirements_file = AGENT_DIR / "requirements.txt"
             if requirements_file.exists():
-                subprocess.run(
-                    [PYTHON_EXE, "-m", "pip", "install", "-r", str(requirements_file)],
-                    cwd=str(AGENT_DIR),
-                    capture_output=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-                )
+                self.install_requirements(requirements_file)
 
             self.log("Update complete")
+            self._record_update_check()
             self.notify("Updated", "Boz Ripper has been updated successfully!")
 
             # Restart agent if it was running
@@ -573,6 +874,45 @@ class BozRipperLauncher:
             self.status = previous_status
             self.update_icon()
 
+    def _record_update_check(self):
+        """Stamp LAST_UPDATE_CHECK_FILE so the next startup can skip the check."""
+        try:
+            LAST_UPDATE_CHECK_FILE.touch()
+        except OSError:
+            pass
+
+    def install_requirements(self, requirements_file: Path):
+        """Run pip install unless requirements.txt matches the last install."""
+        req_hash = hashlib.blake2b(requirements_file.read_bytes(), digest_size=16).hexdigest()
+        try:
+            installed_hash = REQUIREMENTS_HASH_FILE.read_text().strip()
+        except OSError:
+            installed_hash = None
+
+        if req_hash == installed_hash:
+            self.log("Requirements unchanged, skipping pip install")
+            return
+
+        self.log("Installing updated requirements...")
+
+        # Stream pip output into the shared log handle instead of holding it in memory
+        with self._log_lock:
+            self._write_log_buffer()
+            log_handle = self._get_log_handle()
+
+        result = subprocess.run(
+            [PYTHON_EXE, "-m", "pip", "install", "-r", str(requirements_file)],
+            cwd=str(AGENT_DIR),
+            stdout=log_handle,
+            stderr=subprocess.STDOUT,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+        )
+
+        if result.returncode == 0:
+            REQUIREMENTS_HASH_FILE.write_text(req_hash)
+        else:
+            self.log(f"pip install failed with exit code {result.returncode}")
+
     def open_dashboard(self, icon=None, item=None):
         """Open the dashboard in the default browser."""
         self.log(f"Opening dashboard: {DASHBOARD_URL}")
@@ -582,6 +922,7 @@ class BozRipperLauncher:
         """Open the log file in the default text editor."""
         if LOG_FILE.exists():
             self.log("Opening log file...")
+            self.flush_log()
             os.startfile(str(LOG_FILE))
         else:
             self.notify("No Logs", "Log file does not exist yet.")
@@ -590,32 +931,113 @@ class BozRipperLauncher:
         """Exit the launcher application."""
         self.log("Exiting launcher...")
         self.running = False
+        self._wake_monitor()
 
         # Stop agent if running
         if self.is_agent_running():
             self.stop_agent()
 
+        # Flush and close the shared agent.log handle
+        self.flush_log(close=True)
+
         # Stop the icon
         if self.icon:
             self.icon.stop()
 
     def monitor_agent(self):
-        """Background thread to monitor agent health."""
+        """Background thread to monitor agent health.
+
+        Blocks on the agent process itself instead of polling, so the thread
+        only wakes when the agent actually exits. Falls back to polling every
+        adaptive polling where no event-driven wait is available.
+        """
+        # Auto-start agent on launch (after the update check)
+        self._delayed_start()
+
+        if USE_POLLING_MONITOR:
+            self._poll_agent_health()
+            return
+
+        while self.running:
+            # Sleep until an agent is up (or we're shutting down)
+            self._agent_started.wait()
+            self._agent_started.clear()
+
+            process = self.agent_process
+            if not self.running or process is None:
+                continue
+
+            try:
+                exited = self._wait_for_exit(process)
+
+                # Only a crash if it's still the process we're tracking
+                if exited and process is self.agent_process and self.status == AgentStatus.RUNNING:
+                    self._handle_agent_crash()
+            except Exception as e:
+                self.log(f"Monitor error: {e}")
+
+    def _wait_for_exit(self, process) -> bool:
+        """Block until the process exits. Returns False if woken for shutdown."""
+        if sys.platform == "win32":
+            # Waits on the process handle - no CPU used until it exits
+            process.wait()
+            return True
+
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except ProcessLookupError:
+            return True  # Already exited and reaped
+
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            poller.register(self._wakeup_r, select.POLLIN)
+            for fd, _ in poller.poll():
+                if fd == pidfd:
+                    process.poll()  # Reap the child
+                    return True
+            return False
+        finally:
+            os.close(pidfd)
+
+    def _wake_monitor(self):
+        """Wake the monitor thread so it can notice shutdown."""
+        self._agent_started.set()
+        self._wake.set()
+        if self._wakeup_w is not None:
+            try:
+                os.write(self._wakeup_w, b"\0")
+            except OSError:
+                pass
+
+    def _handle_agent_crash(self):
+        """Transition to STOPPED after the agent exits unexpectedly."""
+        self.status = AgentStatus.STOPPED
+        self.update_icon()
+        self.log("Agent crashed or stopped unexpectedly!")
+        self.notify("Agent Crashed", "The agent has stopped unexpectedly. Check logs for details.")
+        self.agent_process = None
+        self.agent_pid = None
+
+    def _poll_agent_health(self):
+        """Polling fallback for platforms without an event-driven wait.
+
+        Re-checks immediately when self._wake is set (agent exit, start/stop)
+        and otherwise backs off through CHECK_INTERVALS while nothing changes.
+        """
         last_status = None
+        backoff = 0
 
         while self.running:
+            # Clear before checking so a wake-up that lands mid-check is kept
+            self._wake.clear()
             try:
                 current_running = self.is_agent_running()
 
                 # Detect status changes
                 if self.status == AgentStatus.RUNNING and not current_running:
                     # Agent crashed
-                    self.status = AgentStatus.STOPPED
-                    self.update_icon()
-                    self.log("Agent crashed or stopped unexpectedly!")
-                    self.notify("Agent Crashed", "The agent has stopped unexpectedly. Check logs for details.")
-                    self.agent_process = None
-                    self.agent_pid = None
+                    self._handle_agent_crash()
 
                 elif self.status == AgentStatus.STOPPED and current_running:
                     # Agent started externally (shouldn't happen with single instance)
@@ -626,28 +1048,35 @@ class BozRipperLauncher:
                 if self.status != last_status:
                     self.update_icon()
                     last_status = self.status
+                    backoff = 0
+                else:
+                    backoff = min(backoff + 1, len(CHECK_INTERVALS) - 1)
 
             except Exception as e:
                 self.log(f"Monitor error: {e}")
 
-            time.sleep(CHECK_INTERVAL)
+            self._wake.wait(timeout=CHECK_INTERVALS[backoff])
+
+    def _wake_on_exit(self, process: subprocess.Popen):
+        """Waiter thread for the polling monitor: wake it the moment the agent exits."""
+        process.wait()
+        self._last_alive_check = (None, 0.0, False)  # Drop the memoized "alive"
+        self._wake.set()
 
     def create_menu(self):
         """Create the system tray menu."""
+        import pystray
+        from pystray import MenuItem as Item
+
         def get_status_text(item):
-            status_emoji = {
-                AgentStatus.RUNNING: "Running",
-                AgentStatus.STOPPED: "Stopped",
-                AgentStatus.UPDATING: "Updating...",
-                AgentStatus.STARTING: "Starting...",
-            }
-            return f"Status: {status_emoji.get(self.status, 'Unknown')}"
+            return _MENU_TEXT_BY_STATUS.get(self.status, "Status: Unknown")
 
         return pystray.Menu(
             Item(get_status_text, None, enabled=False),
             pystray.Menu.SEPARATOR,
-            Item("Start Agent", self.start_agent, enabled=lambda item: not self.is_agent_running()),
-            Item("Stop Agent", self.stop_agent, enabled=lambda item: self.is_agent_running()),
+            # Menu state follows self.status (kept current by the monitor), not an OS probe
+            Item("Start Agent", self.start_agent, enabled=lambda item: self.status != AgentStatus.RUNNING),
+            Item("Stop Agent", self.stop_agent, enabled=lambda item: self.status == AgentStatus.RUNNING),
             Item("Restart Agent", self.restart_agent),
             pystray.Menu.SEPARATOR,
             Item("Open Dashboard", self.open_dashboard),
@@ -659,6 +1088,8 @@ class BozRipperLauncher:
 
     def run(self):
         """Run the system tray application."""
+        import pystray
+
         # Rotate logs if needed before starting
         rotate_logs()
 
@@ -673,34 +1104,45 @@ class BozRipperLauncher:
             self.log(f"Cleaning up {len(existing)} orphaned agent process(es)...")
             kill_existing_agents()
 
-        # Check for updates on startup (in background, don't notify if up to date)
-        if GIT_AVAILABLE:
-            threading.Thread(target=self.check_for_updates, daemon=True).start()
-
-        # Start the monitor thread
-        self.monitor_thread = threading.Thread(target=self.monitor_agent, daemon=True)
-        self.monitor_thread.start()
-
         # Create and run the system tray icon
+        self._last_color = "red"
+        self._last_title = "Boz Ripper Agent - Stopped"
         self.icon = pystray.Icon(
             "BozRipperAgent",
-            self.create_icon_image("red"),
-            "Boz Ripper Agent - Stopped",
+            self._icon_cache[self._last_color],
+            self._last_title,
             self.create_menu(),
         )
 
+        # Run the icon (blocking); startup continues in _on_icon_ready
+        self.icon.run(setup=self._on_icon_ready)
+
+    def _on_icon_ready(self, icon):
+        """pystray setup callback: show the icon, then start the agent.
+
+        Notifications sent before the icon is visible are dropped by most
+        backends, so nothing that notifies runs until this point.
+        """
+        icon.visible = True
+
         self.log("Launcher ready")
         self.notify("Launcher Started", "Boz Ripper Agent Launcher is running.")
 
-        # Auto-start agent on launch (after a delay for update check)
-        threading.Thread(target=self._delayed_start, daemon=True).start()
+        # Check for updates on startup (in background, don't notify if up to
+        # date). Skipping it only lets the auto-start go ahead sooner: the
+        # icon is already visible, so nothing depends on the check's delay
+        if GIT_AVAILABLE and startup_update_check_due():
+            threading.Thread(target=self.check_for_updates, daemon=True).start()
+        else:
+            self._update_done.set()
 
-        # Run the icon (blocking)
-        self.icon.run()
+        # Start the monitor thread (auto-starts the agent once the update check is done)
+        self.monitor_thread = threading.Thread(target=self.monitor_agent, daemon=True)
+        self.monitor_thread.start()
 
     def _delayed_start(self):
-        """Start agent after a short delay (allows update to complete first)."""
-        time.sleep(5)  # Wait for update check
+        """Start agent once the startup update check finishes (or times out)."""
+        self._update_done.wait(timeout=UPDATE_WAIT_TIMEOUT)
         if not self.is_agent_running() and self.status != AgentStatus.UPDATING:
             self.start_agent()
 
@@ -3,8 +3,16 @@
 from pathlib import Path
 from typing import Optional
 
+import yaml
 from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class AgentConfig(BaseModel):
@@ -125,11 +133,47 @@ class Settings(BaseSettings):
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
     @classmethod
-    def from_yaml(cls, path: Path) -> "Settings":
-        """Load settings from a YAML file."""
-        import yaml
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Only read init kwargs and BOZ_* environment variables.
+
+        No .env file or secrets directory is configured, so those sources
+        would only add work to every Settings() construction.
+        """
+        return (init_settings, env_settings)
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
+    @classmethod
+    def from_yaml(cls, path: Path) -> "Settings":
+        """Load settings from a YAML file.
+
+        The parsed YAML is cached per resolved path and modification time, so
+        an unchanged file isn't read again. Every call still builds a fresh
+        Settings, picking up the current BOZ_* environment overrides.
+        """
+        path = Path(path).resolve()
+        mtime_ns = path.stat().st_mtime_ns
+
+        cached = _YAML_CACHE.get(str(path))
+        if cached is not None and cached[0] == mtime_ns:
+            data = cached[1]
+        else:
+            data = _read_yaml(path)
+            _YAML_CACHE[str(path)] = (mtime_ns, data)
 
         return cls(**data) if data else cls()
+
+
+def _read_yaml(path: Path) -> Optional[dict]:
+    """Read and parse a YAML file in one go."""
+    with open(path) as f:
+        return yaml.load(f.read(), Loader=_YAML_LOADER)
+
+
+# YAML read by Settings.from_yaml: path -> (mtime_ns, parsed data)
+_YAML_CACHE: dict[str, tuple[int, Optional[dict]]] = {}
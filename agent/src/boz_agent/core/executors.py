@@ -0,0 +1,23 @@
+"""Default thread pool for blocking calls made from the event loop."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Workers for run_in_executor(None, ...) and asyncio.to_thread - job file
+# renames, unlinks and upload reads. Optical drive probes, which can hang,
+# use DiscDetector's own pool instead.
+BLOCKING_WORKERS = 8
+
+
+def install_default_executor(loop: asyncio.AbstractEventLoop) -> ThreadPoolExecutor:
+    """Give the loop a fixed-size default executor for blocking work.
+
+    Call once, before anything on the loop uses the default executor. The
+    pool is never replaced afterwards; asyncio.run() shuts it down along
+    with the loop.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=BLOCKING_WORKERS, thread_name_prefix="boz_blocking"
+    )
+    loop.set_default_executor(executor)
+    return executor
@@ -1,10 +1,11 @@
 """Main entry point for Boz Ripper Agent."""
 
 import asyncio
+import logging
 import signal
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import structlog
 import typer
@@ -12,11 +13,12 @@ from rich.console import Console
 
 from boz_agent import __version__
 from boz_agent.core.config import Settings
-from boz_agent.services.disc_detector import DiscDetector
-from boz_agent.services.job_runner import JobRunner
-from boz_agent.services.makemkv import MakeMKVService
-from boz_agent.services.server_client import ServerClient
-from boz_agent.services.vlc_detector import VLCInfo, detect_vlc
+from boz_agent.core.executors import install_default_executor
+
+# Services (httpx, ctypes bindings, winreg, ...) are imported by Agent itself,
+# so `version` and `check` don't pay for them
+if TYPE_CHECKING:
+    from boz_agent.services.vlc_detector import VLCInfo
 
 app = typer.Typer(
     name="boz-agent",
@@ -30,12 +32,19 @@ class Agent:
     """Main agent orchestrator."""
 
     def __init__(self, settings: Settings):
+        from boz_agent.services.disc_detector import DiscDetector
+        from boz_agent.services.job_runner import JobRunner
+        from boz_agent.services.makemkv import MakeMKVService
+        from boz_agent.services.server_client import ServerClient
+        from boz_agent.services.vlc_detector import detect_vlc
+
         self.settings = settings
         self.running = False
+        self._stopped = asyncio.Event()
         self._worker_id: Optional[str] = None
 
         # Detect VLC early so it can be used by services
-        self._vlc_info: Optional[VLCInfo] = None
+        self._vlc_info: Optional["VLCInfo"] = None
         if settings.vlc.enabled:
             self._vlc_info = detect_vlc()
             # Use configured path if specified
@@ -114,14 +123,21 @@ class Agent:
         logger.info("agent_stopping")
         self.running = False
 
-        # Stop worker (cancels heartbeat)
-        await self.server_client.stop_worker()
+        try:
+            # Stop worker (cancels heartbeat)
+            await self.server_client.stop_worker()
+
+            await self.job_runner.stop()
+            await self.disc_detector.stop()
+            await self.server_client.unregister()
 
-        await self.job_runner.stop()
-        await self.disc_detector.stop()
-        await self.server_client.unregister()
+            logger.info("agent_stopped")
+        finally:
+            self._stopped.set()
 
-        logger.info("agent_stopped")
+    async def wait_stopped(self) -> None:
+        """Block until stop() has finished."""
+        await self._stopped.wait()
 
     async def handle_disc_inserted(self, drive: str, disc_info: dict) -> None:
         """Handle a disc insertion event."""
@@ -195,35 +211,58 @@ class Agent:
             )
 
 
+_DEFAULT_CONFIG_PATHS = (
+    Path("config/config.yaml"),
+    Path("config.yaml"),
+    Path.home() / ".boz-agent" / "config.yaml",
+)
+
+
 def load_settings(config_path: Optional[Path]) -> Settings:
-    """Load settings from file or defaults."""
-    if config_path and config_path.exists():
-        logger.info("loading_config", path=str(config_path))
-        return Settings.from_yaml(config_path)
-
-    # Try default locations
-    default_paths = [
-        Path("config/config.yaml"),
-        Path("config.yaml"),
-        Path.home() / ".boz-agent" / "config.yaml",
-    ]
-
-    for path in default_paths:
-        if path.exists():
-            logger.info("loading_config", path=str(path))
-            return Settings.from_yaml(path)
+    """Load settings from file or defaults.
+
+    Settings.from_yaml caches the parsed YAML by path and mtime, so a
+    repeated load of an unchanged file skips reading and parsing it. Every
+    call returns a fresh Settings with the current BOZ_* overrides.
+    """
+    # Try the explicit path, then the default locations. from_yaml stats
+    # the file anyway, so a missing file is detected there, not up front.
+    candidates = (config_path,) if config_path else ()
+    for path in (*candidates, *_DEFAULT_CONFIG_PATHS):
+        try:
+            settings = Settings.from_yaml(path)
+        except FileNotFoundError:
+            continue
+        logger.info("loading_config", path=str(path))
+        return settings
 
     logger.info("using_default_config")
     return Settings()
 
 
+def configure_logging(level: str) -> None:
+    """Configure structlog once settings are known.
+
+    Debug calls below the configured level become no-ops, and each module's
+    logger proxy is materialized once on first use instead of on every call.
+    Loggers used before this point are not cached, so they pick it up too.
+    """
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelNamesMapping().get(level.upper(), logging.INFO)
+        ),
+        cache_logger_on_first_use=True,
+    )
+
+
 async def run_agent(settings: Settings) -> None:
     """Run the agent main loop."""
+    loop = asyncio.get_running_loop()
+    install_default_executor(loop)
+
     agent = Agent(settings)
 
     # Set up signal handlers for graceful shutdown
-    loop = asyncio.get_event_loop()
-
     def signal_handler():
         asyncio.create_task(agent.stop())
 
@@ -234,14 +273,14 @@ async def run_agent(settings: Settings) -> None:
     try:
         await agent.start()
 
-        # Keep running until stopped
-        while agent.running:
-            await asyncio.sleep(1)
+        # Keep running until stopped - no wake-ups while idle
+        await agent.wait_stopped()
 
     except KeyboardInterrupt:
         pass
     finally:
-        await agent.stop()
+        if agent.running:
+            await agent.stop()
 
 
 @app.command()
@@ -255,6 +294,7 @@ def run(
 ) -> None:
     """Run the Boz Ripper agent."""
     settings = load_settings(config)
+    configure_logging(settings.logging.level)
     asyncio.run(run_agent(settings))
 
 
@@ -1,18 +1,37 @@
 """Agent services - disc detection, MakeMKV interface, server communication."""
 
-from .disc_detector import DiscDetector
-from .job_runner import JobRunner
-from .makemkv import DiscAnalysis, MakeMKVService, Title
-from .server_client import ServerClient
-from .worker import TranscodeJob, WorkerService
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
-    "DiscDetector",
-    "DiscAnalysis",
-    "JobRunner",
-    "MakeMKVService",
-    "Title",
-    "ServerClient",
-    "TranscodeJob",
-    "WorkerService",
-]
+if TYPE_CHECKING:
+    from .disc_detector import DiscDetector
+    from .job_runner import JobRunner
+    from .makemkv import DiscAnalysis, MakeMKVService, Title
+    from .server_client import ServerClient
+    from .worker import TranscodeJob, WorkerService
+
+# Exported name -> submodule. Submodules are imported on first attribute
+# access (PEP 562), so importing one service doesn't load all the others.
+_EXPORTS = {
+    "DiscAnalysis": "makemkv",
+    "DiscDetector": "disc_detector",
+    "JobRunner": "job_runner",
+    "MakeMKVService": "makemkv",
+    "ServerClient": "server_client",
+    "Title": "makemkv",
+    "TranscodeJob": "worker",
+    "WorkerService": "worker",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule behind an exported name on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
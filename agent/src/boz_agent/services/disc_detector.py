@@ -2,8 +2,9 @@
 
 import asyncio
 import ctypes
-import os
 import string
+import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from ctypes import wintypes
 from typing import Callable, Optional
@@ -14,8 +15,8 @@ from boz_agent.core.config import DiscDetectionConfig
 
 logger = structlog.get_logger()
 
-# Thread pool for blocking I/O operations
-_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="disc_detector")
+# Per-thread GetVolumeInformationW output buffers, reused across polls
+_volume_buffers = threading.local()
 
 # Windows constants for disc ejection
 GENERIC_READ = 0x80000000
@@ -23,12 +24,112 @@ FILE_SHARE_READ = 0x00000001
 FILE_SHARE_WRITE = 0x00000002
 OPEN_EXISTING = 3
 IOCTL_STORAGE_EJECT_MEDIA = 0x2D4808
+DRIVE_CDROM = 5
+SEM_FAILCRITICALERRORS = 0x0001
+THREAD_TERMINATE = 0x0001  # Access right CancelSynchronousIo needs
+
+# Polling backoff for drives that stay empty: the interval doubles every
+# EMPTY_POLLS_PER_BACKOFF empty checks, up to IDLE_POLL_INTERVAL_MAX seconds
+EMPTY_POLLS_PER_BACKOFF = 6
+IDLE_POLL_INTERVAL_MAX = 60
+
+# While volume notifications are live, every drive is still checked each
+# poll_interval * NOTIFIED_POLL_FACTOR seconds in case a broadcast was missed
+NOTIFIED_POLL_FACTOR = 12
+# Optical media is often not readable yet when its arrival is broadcast, so a
+# notified drive is re-checked up to ARRIVAL_RECHECKS times, this far apart
+ARRIVAL_RECHECKS = 5
+ARRIVAL_RECHECK_DELAY = 2.0
+
+# Volume label fragments that mark a Blu-ray disc
+_BLURAY_LABEL_MARKERS = ("BD", "BLU", "UHD")
+
+# kernel32 entry points, bound once with explicit prototypes so ctypes
+# doesn't infer argument conversions on every call. A private WinDLL keeps
+# these prototypes from leaking into other users of ctypes.windll.kernel32.
+if sys.platform == "win32":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _GetLogicalDrives = _kernel32.GetLogicalDrives
+    _GetLogicalDrives.argtypes = []
+    _GetLogicalDrives.restype = wintypes.DWORD
+
+    _GetDriveTypeW = _kernel32.GetDriveTypeW
+    _GetDriveTypeW.argtypes = [wintypes.LPCWSTR]
+    _GetDriveTypeW.restype = wintypes.UINT
+
+    _GetVolumeInformationW = _kernel32.GetVolumeInformationW
+    _GetVolumeInformationW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.LPWSTR, wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+        ctypes.POINTER(wintypes.DWORD),
+        ctypes.POINTER(wintypes.DWORD),
+        wintypes.LPWSTR, wintypes.DWORD,
+    ]
+    _GetVolumeInformationW.restype = wintypes.BOOL
+
+    _CreateFileW = _kernel32.CreateFileW
+    _CreateFileW.argtypes = [
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+    ]
+    _CreateFileW.restype = wintypes.HANDLE
+
+    _DeviceIoControl = _kernel32.DeviceIoControl
+    _DeviceIoControl.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p,
+    ]
+    _DeviceIoControl.restype = wintypes.BOOL
+
+    _SetThreadErrorMode = _kernel32.SetThreadErrorMode
+    _SetThreadErrorMode.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+    _SetThreadErrorMode.restype = wintypes.BOOL
+
+    _OpenThread = _kernel32.OpenThread
+    _OpenThread.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _OpenThread.restype = wintypes.HANDLE
+
+    _CancelSynchronousIo = _kernel32.CancelSynchronousIo
+    _CancelSynchronousIo.argtypes = [wintypes.HANDLE]
+    _CancelSynchronousIo.restype = wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+
+def _get_volume_buffers() -> threading.local:
+    """Return this executor thread's GetVolumeInformationW buffers."""
+    buffers = _volume_buffers
+    if not hasattr(buffers, "volume_name"):
+        # First use on this worker thread: never show the "no disk in drive"
+        # dialog for an empty drive. Per-thread, so the rest of the process
+        # keeps its error mode.
+        _SetThreadErrorMode(SEM_FAILCRITICALERRORS, None)
+        buffers.volume_name = ctypes.create_unicode_buffer(261)
+        buffers.file_system = ctypes.create_unicode_buffer(261)
+        buffers.serial = wintypes.DWORD()
+        buffers.max_len = wintypes.DWORD()
+        buffers.flags = wintypes.DWORD()
+        buffers.serial_ref = ctypes.byref(buffers.serial)
+        buffers.max_len_ref = ctypes.byref(buffers.max_len)
+        buffers.flags_ref = ctypes.byref(buffers.flags)
+    return buffers
 
 
 class DiscDetector:
     """Monitors optical drives for disc insertion/ejection events.
 
     Uses non-blocking polling with thread pool to avoid blocking the event loop.
+    On Windows, volume change notifications replace regular polling: a drive
+    is checked when media arrives in or leaves it, with a slow safety poll
+    behind that.
     """
 
     def __init__(
@@ -44,6 +145,18 @@ class DiscDetector:
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._known_discs: dict[str, dict] = {}
+        self._drives_changed: Optional[asyncio.Event] = None
+        self._pending_drives: set[str] = set()
+        self._empty_streak: dict[str, int] = {}
+        # Notified drives not yet reporting a disc -> re-checks left
+        self._arrival_rechecks: dict[str, int] = {}
+        # Native IDs of executor threads currently blocked reading a drive
+        self._io_threads: set[int] = set()
+        self._io_threads_lock = threading.Lock()
+        # Drive I/O can hang on a spinning-up or damaged disc, so it gets a
+        # pool of its own rather than the loop's default executor
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._volume_listener = None
 
     async def start(self) -> None:
         """Start monitoring for disc events."""
@@ -61,6 +174,15 @@ class DiscDetector:
 
         logger.info("optical_drives_found", drives=drives)
 
+        # Drives are checked concurrently, so a stalled one can't hold up the
+        # rest; leave room for ejects and the volume listener start-up
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(drives) + 2, thread_name_prefix="disc_detector"
+        )
+
+        self._drives_changed = asyncio.Event()
+        await self._start_volume_listener(drives)
+
         # Start the monitoring loop
         self._task = asyncio.create_task(self._monitor_loop(drives))
         logger.info("disc_monitor_started", drives=drives)
@@ -77,16 +199,105 @@ class DiscDetector:
                 pass
             self._task = None
 
+        # Don't leave worker threads stuck on a slow drive after shutdown
+        self._cancel_pending_io()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        if self._volume_listener:
+            # Joins the listener thread, so keep it off the event loop
+            await asyncio.to_thread(self._volume_listener.stop)
+            self._volume_listener = None
+
         logger.info("disc_detector_stopped")
 
+    async def _start_volume_listener(self, drives: list[str]) -> None:
+        """Subscribe to volume change notifications for the watched drives."""
+        if sys.platform != "win32":
+            return
+
+        from boz_agent.services.volume_notifier import VolumeChangeListener
+
+        loop = asyncio.get_running_loop()
+        watched = {drive.upper(): drive for drive in drives}
+
+        def on_change(changed: list[str]) -> None:
+            # Called on the listener thread
+            hits = [watched[letter] for letter in changed if letter in watched]
+            if hits:
+                loop.call_soon_threadsafe(self._queue_drive_changes, hits)
+
+        try:
+            listener = VolumeChangeListener(on_change)
+            if await loop.run_in_executor(self._executor, listener.start):
+                self._volume_listener = listener
+                logger.info("volume_notifications_enabled")
+            else:
+                # Start timed out or failed; close a window that shows up late
+                listener.stop(timeout=0)
+        except Exception as e:
+            logger.warning("volume_notifications_failed", error=str(e))
+
+    def _queue_drive_changes(self, drives: list[str]) -> None:
+        """Record drives reported by the volume listener and wake the loop."""
+        self._pending_drives.update(drives)
+        # Removals are reported too; re-checking an empty drive is cheap
+        for drive in drives:
+            self._arrival_rechecks[drive] = ARRIVAL_RECHECKS
+        self._drives_changed.set()
+
+    async def _wait_for_next_poll(self, drives: list[str]) -> list[str]:
+        """Wait until drives need checking and return which ones.
+
+        With volume notifications this returns just the drives a notification
+        named, notified drives still due a re-check, or every drive once the
+        safety interval has passed. Otherwise it returns every drive once the
+        polling interval has passed.
+        """
+        if not self._volume_listener:
+            timeout = self._current_poll_interval(drives)
+        elif self._arrival_rechecks:
+            timeout = ARRIVAL_RECHECK_DELAY
+        else:
+            timeout = self.config.poll_interval * NOTIFIED_POLL_FACTOR
+
+        try:
+            async with asyncio.timeout(timeout):
+                await self._drives_changed.wait()
+        except asyncio.TimeoutError:
+            if self._volume_listener and self._arrival_rechecks:
+                return self._take_arrival_rechecks(drives)
+            return drives
+
+        self._drives_changed.clear()
+        pending, self._pending_drives = self._pending_drives, set()
+        return [drive for drive in drives if drive in pending] or drives
+
+    def _take_arrival_rechecks(self, drives: list[str]) -> list[str]:
+        """Return the drives due an arrival re-check, counting this one."""
+        due = [drive for drive in drives if drive in self._arrival_rechecks]
+        for drive in due:
+            self._arrival_rechecks[drive] -= 1
+            if self._arrival_rechecks[drive] <= 0:
+                del self._arrival_rechecks[drive]
+        return due
+
+    def _current_poll_interval(self, drives: list[str]) -> float:
+        """Polling interval, backed off while every drive stays empty."""
+        base = self.config.poll_interval
+        streak = min((self._empty_streak.get(drive, 0) for drive in drives), default=0)
+        backoff = 2 ** min(streak // EMPTY_POLLS_PER_BACKOFF, 6)
+        return min(base * backoff, max(base, IDLE_POLL_INTERVAL_MAX))
+
     async def _discover_drives_async(self) -> list[str]:
         """Discover optical drives without blocking."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(_executor, self._discover_drives_sync),
-                timeout=10.0
-            )
+            async with asyncio.timeout(10.0):
+                # Default pool: drive types come from the mount table, so
+                # no media is touched and nothing here can hang
+                return await loop.run_in_executor(None, self._discover_drives_sync)
         except asyncio.TimeoutError:
             logger.warning("drive_discovery_timeout")
             return ["I:"]  # Fallback to I: drive
@@ -94,12 +305,16 @@ class DiscDetector:
     def _discover_drives_sync(self) -> list[str]:
         """Discover optical drives (runs in thread)."""
         drives = []
-        DRIVE_CDROM = 5
 
-        for letter in string.ascii_uppercase:
+        # One call for the bitmask of existing drives, then only probe those
+        drive_mask = _GetLogicalDrives()
+
+        for i, letter in enumerate(string.ascii_uppercase):
+            if not drive_mask >> i & 1:
+                continue
             try:
                 drive_path = f"{letter}:\\"
-                drive_type = ctypes.windll.kernel32.GetDriveTypeW(drive_path)
+                drive_type = _GetDriveTypeW(drive_path)
                 if drive_type == DRIVE_CDROM:
                     drives.append(f"{letter}:")
                     logger.debug("optical_drive_found", drive=f"{letter}:")
@@ -110,14 +325,26 @@ class DiscDetector:
 
     async def _monitor_loop(self, drives: list[str]) -> None:
         """Main monitoring loop - non-blocking."""
+        # Every drive is checked once up front, then only when due
+        to_check = drives
         while self._running:
             try:
-                for drive in drives:
-                    # Run disc check in thread with timeout
-                    disc_info = await self._check_drive_async(drive)
+                # Check drives in parallel; each runs in a thread with a timeout
+                results = await asyncio.gather(
+                    *(self._check_drive_async(drive) for drive in to_check),
+                    return_exceptions=True,
+                )
+                for drive, disc_info in zip(to_check, results):
+                    if isinstance(disc_info, Exception):
+                        continue
                     await self._handle_disc_change(drive, disc_info)
+                    if disc_info:
+                        self._arrival_rechecks.pop(drive, None)
+                    self._empty_streak[drive] = (
+                        0 if disc_info else self._empty_streak.get(drive, 0) + 1
+                    )
 
-                await asyncio.sleep(self.config.poll_interval)
+                to_check = await self._wait_for_next_poll(drives)
 
             except asyncio.CancelledError:
                 break
@@ -127,12 +354,15 @@ class DiscDetector:
 
     async def _check_drive_async(self, drive: str) -> Optional[dict]:
         """Check drive for disc - runs in thread with timeout."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(_executor, self._get_disc_info_sync, drive),
-                timeout=5.0  # 5 second timeout per drive
-            )
+            async with asyncio.timeout(5.0):  # 5 second timeout per drive
+                return await loop.run_in_executor(
+                    self._executor,
+                    self._get_disc_info_sync,
+                    drive,
+                    self._known_discs.get(drive),
+                )
         except asyncio.TimeoutError:
             logger.debug("disc_check_timeout", drive=drive)
             return None
@@ -164,54 +394,87 @@ class DiscDetector:
                 except Exception as e:
                     logger.error("disc_ejected_callback_error", error=str(e))
 
-    def _get_disc_info_sync(self, drive: str) -> Optional[dict]:
+    def _get_disc_info_sync(
+        self, drive: str, cached_info: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Get disc info, registering this thread so stop() can cancel its I/O."""
+        thread_id = threading.get_native_id()
+        with self._io_threads_lock:
+            self._io_threads.add(thread_id)
+        try:
+            return self._read_disc_info_sync(drive, cached_info)
+        finally:
+            with self._io_threads_lock:
+                self._io_threads.discard(thread_id)
+
+    def _cancel_pending_io(self) -> None:
+        """Abort drive reads still blocking executor threads (Windows only)."""
+        if sys.platform != "win32":
+            return
+
+        with self._io_threads_lock:
+            thread_ids = list(self._io_threads)
+
+        for thread_id in thread_ids:
+            handle = _OpenThread(THREAD_TERMINATE, False, thread_id)
+            if not handle:
+                continue
+            try:
+                if _CancelSynchronousIo(handle):
+                    logger.debug("disc_io_cancelled", thread_id=thread_id)
+            finally:
+                _CloseHandle(handle)
+
+    def _read_disc_info_sync(
+        self, drive: str, cached_info: Optional[dict] = None
+    ) -> Optional[dict]:
         """Get disc info - simple and fast (runs in thread).
 
-        Uses os.path.exists and os.listdir for quick detection,
-        then ctypes for volume name if disc is present.
+        GetVolumeInformationW doubles as the presence check: it fails with
+        ERROR_NOT_READY on an empty drive, so the media is never walked.
+        While a known disc stays in the drive, only its serial number is
+        queried and the cached info is returned as-is.
         """
         drive_path = f"{drive}\\"
 
         try:
-            # Quick check - can we access the drive?
-            if not os.path.exists(drive_path):
-                return None
+            buffers = _get_volume_buffers()
 
-            # Try to list the drive - this confirms disc is readable
-            try:
-                os.listdir(drive_path)
-            except (OSError, PermissionError):
-                return None
-
-            # Disc is present - get volume info
-            volume_name = "Unknown"
-            file_system = "Unknown"
-
-            try:
-                volume_name_buf = ctypes.create_unicode_buffer(261)
-                file_system_buf = ctypes.create_unicode_buffer(261)
-                serial = ctypes.c_ulong()
-                max_len = ctypes.c_ulong()
-                flags = ctypes.c_ulong()
-
-                result = ctypes.windll.kernel32.GetVolumeInformationW(
-                    drive_path,
-                    volume_name_buf, 261,
-                    ctypes.byref(serial),
-                    ctypes.byref(max_len),
-                    ctypes.byref(flags),
-                    file_system_buf, 261
+            if cached_info is not None:
+                result = _GetVolumeInformationW(
+                    drive_path, None, 0, buffers.serial_ref, None, None, None, 0
                 )
+                if not result:
+                    return None
+                if buffers.serial.value == cached_info.get("serial"):
+                    return cached_info
+                # A different disc was swapped in - read it in full below
+
+            volume_name_buf = buffers.volume_name
+            file_system_buf = buffers.file_system
+            volume_name_buf.value = ""
+            file_system_buf.value = ""
+
+            result = _GetVolumeInformationW(
+                drive_path,
+                volume_name_buf, 261,
+                buffers.serial_ref,
+                buffers.max_len_ref,
+                buffers.flags_ref,
+                file_system_buf, 261
+            )
 
-                if result:
-                    volume_name = volume_name_buf.value or "Unknown"
-                    file_system = file_system_buf.value or "Unknown"
-            except Exception:
-                pass  # Use defaults
+            if not result:
+                # No disc (ERROR_NOT_READY) or nothing readable on it
+                return None
+
+            volume_name = volume_name_buf.value or "Unknown"
+            file_system = file_system_buf.value or "Unknown"
 
             # Determine media type
             media_type = "DVD" if file_system == "UDF" else "CD"
-            if "BD" in volume_name.upper() or "BLU" in volume_name.upper():
+            label = volume_name.upper()
+            if any(marker in label for marker in _BLURAY_LABEL_MARKERS):
                 media_type = "Blu-ray"
 
             return {
@@ -219,6 +482,7 @@ class DiscDetector:
                 "name": volume_name,
                 "media_type": media_type,
                 "file_system": file_system,
+                "serial": buffers.serial.value,
             }
 
         except Exception as e:
@@ -242,12 +506,12 @@ class DiscDetector:
 
         logger.info("ejecting_disc", drive=drive_letter)
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
-            success = await asyncio.wait_for(
-                loop.run_in_executor(_executor, self._eject_disc_sync, drive_letter),
-                timeout=10.0,
-            )
+            async with asyncio.timeout(10.0):
+                success = await loop.run_in_executor(
+                    self._executor, self._eject_disc_sync, drive_letter
+                )
             if success:
                 logger.info("disc_ejected_successfully", drive=drive_letter)
                 # Remove from known discs immediately
@@ -277,7 +541,7 @@ class DiscDetector:
 
         try:
             # Open the drive device
-            handle = ctypes.windll.kernel32.CreateFileW(
+            handle = _CreateFileW(
                 device_path,
                 GENERIC_READ,
                 FILE_SHARE_READ | FILE_SHARE_WRITE,
@@ -287,14 +551,14 @@ class DiscDetector:
                 None,
             )
 
-            if handle == -1 or handle == wintypes.HANDLE(-1).value:
+            if handle is None or handle == INVALID_HANDLE_VALUE:
                 logger.warning("eject_open_drive_failed", drive=drive_letter)
                 return False
 
             try:
                 # Send eject command
                 bytes_returned = wintypes.DWORD()
-                result = ctypes.windll.kernel32.DeviceIoControl(
+                result = _DeviceIoControl(
                     handle,
                     IOCTL_STORAGE_EJECT_MEDIA,
                     None,
@@ -309,7 +573,7 @@ class DiscDetector:
 
             finally:
                 # Close handle
-                ctypes.windll.kernel32.CloseHandle(handle)
+                _CloseHandle(handle)
 
         except Exception as e:
             logger.error("eject_exception", drive=drive_letter, error=str(e))
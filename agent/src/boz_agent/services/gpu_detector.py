@@ -1,14 +1,26 @@
-"""GPU detection for transcoding capabilities."""
+"""GPU detection for transcoding capabilities.
 
+Detection results are cached for the life of the process, since the hardware
+doesn't change while the agent runs. GPUInfo is frozen, so the shared cached
+objects can't be changed by a caller. Call ``cache_clear()`` on the detect
+functions to probe again.
+"""
+
+import functools
 import logging
+import re
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# HandBrake software encoders, by codec
+_CPU_ENCODERS = {"h264": "x264", "h265": "x265", "hevc": "x265", "av1": "svt_av1"}
+
+
+@dataclass(frozen=True, slots=True)
 class GPUInfo:
     """Information about a detected GPU."""
 
@@ -19,8 +31,82 @@ class GPUInfo:
     qsv: bool = False
     hevc: bool = False
     av1: bool = False
+    # HandBrake encoder by codec, worked out once from the fields above
+    # (safe to keep: the instance is frozen)
+    encoders: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.vendor == "nvidia" and self.nvenc:
+            h264 = "nvenc_h264"
+            h265 = "nvenc_h265" if self.hevc else h264
+            av1 = "nvenc_av1" if self.av1 else h264
+        elif self.vendor == "intel" and self.qsv:
+            h264 = "qsv_h264"
+            h265 = "qsv_h265" if self.hevc else h264
+            av1 = h264
+        else:
+            # No usable hardware encoder - fall back to CPU
+            h264, h265, av1 = "x264", "x265", "x264"
+
+        encoders = {"h264": h264, "h265": h265, "hevc": h265, "av1": av1}
+        object.__setattr__(self, "encoders", encoders)
+
+
+# NVENC capabilities by GPU name, newest generation first. The first
+# pattern found anywhere in the name wins: (generation, hevc, av1)
+_NVENC_GENERATIONS = (
+    # RTX 40 series (Ada Lovelace) - NVENC 9th gen, adds AV1 encoding
+    (re.compile(r"rtx ?40|40[6-9]0"), (9, True, True)),
+    # RTX 30 series (Ampere) - NVENC 8th gen
+    (re.compile(r"rtx ?30|30[6-9]0"), (8, True, False)),
+    # RTX 20 / GTX 16 series (Turing) - NVENC 7th gen
+    (re.compile(r"rtx ?20|20[6-8]0|gtx 16|16[56]0"), (7, True, False)),
+    # GTX 10 series (Pascal) - NVENC 6th gen
+    (re.compile(r"gtx 10|10[5-8]0"), (6, True, False)),
+    # Older GPUs
+    (re.compile(r"gtx|nvidia"), (5, False, False)),
+)
+
+
+def _nvenc_capabilities(gpu_name: str) -> tuple[int, bool, bool]:
+    """Look up (NVENC generation, HEVC, AV1) support for an NVIDIA GPU name."""
+    gpu_lower = gpu_name.lower()
+    for pattern, capabilities in _NVENC_GENERATIONS:
+        if pattern.search(gpu_lower):
+            return capabilities
+    return 0, False, False
+
+
+def _nvml_gpu_name() -> Optional[str]:
+    """Get the first NVIDIA GPU's name through NVML (pynvml).
+
+    Returns:
+        GPU name, or None if pynvml isn't installed or NVML can't be used
+    """
+    try:
+        import pynvml
+    except ImportError:
+        return None
 
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError as e:
+        logger.debug(f"NVML unavailable: {e}")
+        return None
+
+    try:
+        name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(0))
+    except pynvml.NVMLError as e:
+        logger.debug(f"NVML device query failed: {e}")
+        return None
+    finally:
+        pynvml.nvmlShutdown()
 
+    # Older pynvml releases return bytes
+    return name.decode() if isinstance(name, bytes) else name
+
+
+@functools.lru_cache(maxsize=None)
 def detect_nvidia_gpu() -> Optional[GPUInfo]:
     """Detect NVIDIA GPU and its capabilities.
 
@@ -28,65 +114,30 @@ def detect_nvidia_gpu() -> Optional[GPUInfo]:
         GPUInfo if NVIDIA GPU found, None otherwise
     """
     try:
-        # Try nvidia-smi to get GPU info
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        if result.returncode != 0:
-            return None
-
-        gpu_name = result.stdout.strip()
+        # NVML answers in-process; nvidia-smi is the fallback without it
+        gpu_name = _nvml_gpu_name()
+        if gpu_name is None:
+            result = subprocess.run(
+                ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
+                capture_output=True,
+                encoding="ascii",
+                errors="replace",
+                timeout=10,
+                # No console window flash when run from the tray launcher
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+
+            if result.returncode != 0:
+                return None
+
+            gpu_name = result.stdout.strip()
         if not gpu_name:
             return None
 
         logger.info(f"Detected NVIDIA GPU: {gpu_name}")
 
         # Determine NVENC generation and capabilities based on GPU name
-        nvenc_gen = 0
-        hevc = False
-        av1 = False
-
-        gpu_lower = gpu_name.lower()
-
-        # RTX 40 series (Ada Lovelace) - NVENC 9th gen
-        if any(x in gpu_lower for x in ["rtx 40", "rtx40", "4090", "4080", "4070", "4060"]):
-            nvenc_gen = 9
-            hevc = True
-            av1 = True  # RTX 40 series supports AV1 encoding
-
-        # RTX 30 series (Ampere) - NVENC 8th gen
-        elif any(x in gpu_lower for x in ["rtx 30", "rtx30", "3090", "3080", "3070", "3060"]):
-            nvenc_gen = 8
-            hevc = True
-            av1 = False
-
-        # RTX 20 series (Turing) - NVENC 7th gen
-        elif any(x in gpu_lower for x in ["rtx 20", "rtx20", "2080", "2070", "2060"]):
-            nvenc_gen = 7
-            hevc = True
-            av1 = False
-
-        # GTX 16 series (Turing) - NVENC 7th gen
-        elif any(x in gpu_lower for x in ["gtx 16", "1660", "1650"]):
-            nvenc_gen = 7
-            hevc = True
-            av1 = False
-
-        # GTX 10 series (Pascal) - NVENC 6th gen
-        elif any(x in gpu_lower for x in ["gtx 10", "1080", "1070", "1060", "1050"]):
-            nvenc_gen = 6
-            hevc = True
-            av1 = False
-
-        # Older GPUs
-        elif "gtx" in gpu_lower or "nvidia" in gpu_lower:
-            nvenc_gen = 5
-            hevc = False
-            av1 = False
+        nvenc_gen, hevc, av1 = _nvenc_capabilities(gpu_name)
 
         return GPUInfo(
             name=gpu_name,
@@ -109,6 +160,7 @@ def detect_nvidia_gpu() -> Optional[GPUInfo]:
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def detect_intel_gpu() -> Optional[GPUInfo]:
     """Detect Intel GPU with QuickSync support.
 
@@ -155,6 +207,7 @@ def detect_intel_gpu() -> Optional[GPUInfo]:
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def detect_gpu() -> Optional[GPUInfo]:
     """Detect the best available GPU for transcoding.
 
@@ -187,32 +240,5 @@ def get_handbrake_encoder(gpu: Optional[GPUInfo], codec: str = "h264") -> str:
     Returns:
         HandBrake encoder name
     """
-    codec = codec.lower()
-
-    if gpu is None:
-        # CPU encoders
-        if codec in ("h265", "hevc"):
-            return "x265"
-        elif codec == "av1":
-            return "svt_av1"
-        else:
-            return "x264"
-
-    if gpu.vendor == "nvidia" and gpu.nvenc:
-        if codec in ("h265", "hevc") and gpu.hevc:
-            return "nvenc_h265"
-        elif codec == "av1" and gpu.av1:
-            return "nvenc_av1"
-        else:
-            return "nvenc_h264"
-
-    if gpu.vendor == "intel" and gpu.qsv:
-        if codec in ("h265", "hevc") and gpu.hevc:
-            return "qsv_h265"
-        else:
-            return "qsv_h264"
-
-    # Fallback to CPU
-    if codec in ("h265", "hevc"):
-        return "x265"
-    return "x264"
+    encoders = _CPU_ENCODERS if gpu is None else gpu.encoders
+    return encoders.get(codec.lower(), encoders["h264"])
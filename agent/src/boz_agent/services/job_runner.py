@@ -16,6 +16,99 @@ from boz_agent.services.worker import WorkerService, TranscodeJob
 
 logger = structlog.get_logger()
 
+# Seconds the server may hold a job request open waiting for an assignment
+JOB_LONG_POLL_TIMEOUT = 30
+# Minimum seconds between job requests, for when the server answers at once
+# (a job is waiting on something else, or the server doesn't long-poll)
+JOB_POLL_INTERVAL = 5
+# Seconds between server cancellation checks while a transcode runs
+TRANSCODE_CANCEL_CHECK_INTERVAL = 10
+
+
+class ProgressThrottler:
+    """Forwards job progress to the server without an RPC per progress tick.
+
+    submit() never blocks: the newest value replaces any that hasn't been
+    sent yet, and a single task sends it once progress has moved min_step
+    percent or min_interval seconds have passed since the last update.
+    """
+
+    def __init__(
+        self,
+        server_client: ServerClient,
+        job_id: str,
+        min_step: float = 1.0,
+        min_interval: float = 2.0,
+    ):
+        self.server_client = server_client
+        self.job_id = job_id
+        self.min_step = min_step
+        self.min_interval = min_interval
+
+        self._queue: asyncio.Queue[Optional[float]] = asyncio.Queue(maxsize=1)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the sender task."""
+        self._task = asyncio.create_task(self._send_loop())
+
+    def submit(self, progress: float) -> None:
+        """Queue a progress value, replacing any unsent one."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(progress)
+
+    async def stop(self) -> None:
+        """Drop unsent progress and wait for an in-flight update to finish.
+
+        Call this before sending a final status, so a late progress update
+        can't overwrite it on the server.
+        """
+        if not self._task:
+            return
+
+        task, self._task = self._task, None
+        if task.done():
+            # Ended early; nothing is in flight, so just drop what's queued
+            if not task.cancelled() and task.exception():
+                logger.warning("progress_sender_failed", job_id=self.job_id)
+            return
+
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def _send_loop(self) -> None:
+        """Send queued progress values that clear the step/interval bar."""
+        loop = asyncio.get_running_loop()
+        last_sent: Optional[float] = None
+        last_sent_at = 0.0
+
+        while True:
+            progress = await self._queue.get()
+            if progress is None:
+                return
+
+            now = loop.time()
+            if (
+                last_sent is None
+                or abs(progress - last_sent) >= self.min_step
+                or now - last_sent_at >= self.min_interval
+            ):
+                try:
+                    await self.server_client.update_job_status(
+                        self.job_id, "running", progress=progress
+                    )
+                except Exception as e:
+                    # Keep going; the next value will be tried again
+                    logger.warning(
+                        "progress_update_failed", job_id=self.job_id, error=str(e)
+                    )
+                    continue
+                last_sent = progress
+                last_sent_at = now
+
 
 class JobRunner:
     """Polls for assigned jobs and executes them."""
@@ -50,14 +143,34 @@ class JobRunner:
         # Worker for transcoding (if enabled)
         self.worker: Optional[WorkerService] = None
         if settings.worker.enabled:
-            from boz_agent.core.config import HandBrakeConfig, WorkerConfig
             self.worker = WorkerService(settings.worker, settings.handbrake)
 
+        # Encoder family for transcodes, derived once from the config flags
+        worker_config = settings.worker
+        self._gpu_type = (
+            "nvenc" if worker_config.nvenc else ("qsv" if worker_config.qsv else "cpu")
+        )
+        if worker_config.nvenc and worker_config.qsv:
+            logger.warning("worker_gpu_flags_conflict", using=self._gpu_type)
+
         self._running = False
         self._poll_task: Optional[asyncio.Task] = None
         self._vlc_poll_task: Optional[asyncio.Task] = None  # Separate task for VLC commands
         self._current_job: Optional[dict] = None
+        # Discs sent along with the last job poll, keyed by disc_id
+        self._disc_cache: dict[str, dict] = {}
+        # Jobs returned by the last job poll
+        self._polled_jobs: list[dict] = []
+        # Discs whose completion check waits on other queued rips: disc_id -> drive
+        self._deferred_disc_checks: dict[str, str] = {}
         self._rip_in_progress = False  # Only allow one rip at a time (single drive)
+        # Transcodes run as tasks so one doesn't hold up the next; the
+        # semaphore bounds them to the worker's job slots
+        self._transcode_sem = asyncio.Semaphore(settings.worker.max_concurrent_jobs)
+        self._transcode_tasks: set[asyncio.Task] = set()
+        self._dispatched_job_ids: set[str] = set()
+        # Housekeeping (e.g. staging cleanup) that jobs don't wait for
+        self._bg_tasks: set[asyncio.Task] = set()
 
     async def start(self) -> None:
         """Start the job runner."""
@@ -65,13 +178,7 @@ class JobRunner:
 
         if self.worker:
             await self.worker.start()
-            # Derive gpu_type from config flags
-            gpu_type = "cpu"
-            if self.settings.worker.nvenc:
-                gpu_type = "nvenc"
-            elif self.settings.worker.qsv:
-                gpu_type = "qsv"
-            logger.info("job_runner_started", worker_enabled=True, gpu=gpu_type)
+            logger.info("job_runner_started", worker_enabled=True, gpu=self._gpu_type)
         else:
             logger.info("job_runner_started", worker_enabled=False)
 
@@ -98,6 +205,13 @@ class JobRunner:
             except asyncio.CancelledError:
                 pass
 
+        for task in self._transcode_tasks:
+            task.cancel()
+        await asyncio.gather(*self._transcode_tasks, return_exceptions=True)
+
+        # Let in-flight cleanup finish so no staging files are left behind
+        await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
         if self.worker:
             await self.worker.stop()
 
@@ -116,15 +230,30 @@ class JobRunner:
                 await asyncio.sleep(5)
 
     async def _poll_loop(self) -> None:
-        """Poll for jobs and execute them."""
+        """Poll for jobs and execute them.
+
+        Uses a long-poll, so a newly assigned job is picked up as soon as the
+        server assigns it instead of on the next fixed poll.
+        """
+        loop = asyncio.get_running_loop()
         while self._running:
             try:
-                # Get assigned jobs
-                jobs = await self.server_client.get_pending_jobs()
+                # Get assigned jobs, waiting on the server until there are some
+                started = loop.time()
+                state = await self.server_client.poll_agent_state(
+                    wait=JOB_LONG_POLL_TIMEOUT
+                )
+                jobs = state.jobs
+                self._disc_cache = state.discs
+                self._polled_jobs = jobs
+                await self._run_deferred_disc_checks()
 
                 for job in jobs:
                     if job.get("status") != "assigned":
                         continue
+                    # Already handed to a transcode task, still waiting its turn
+                    if job["job_id"] in self._dispatched_job_ids:
+                        continue
 
                     job_type = job.get("job_type")
 
@@ -133,14 +262,21 @@ class JobRunner:
                         if self._rip_in_progress:
                             logger.debug("rip_job_queued", job_id=job["job_id"], reason="another rip in progress")
                             continue
+                        # Left assigned until the user decides on the preview;
+                        # the decision wakes the long-poll
+                        if self._awaiting_preview(job):
+                            logger.debug("rip_job_queued", job_id=job["job_id"], reason="preview pending")
+                            continue
                         # Execute the rip job (only one per poll cycle)
                         await self._execute_job(job)
                         break  # Don't process more jobs this cycle
                     else:
-                        # Transcode jobs can run in parallel via WorkerService
-                        await self._execute_job(job)
+                        # Transcode jobs run in parallel via WorkerService
+                        self._dispatch_transcode(job)
 
-                await asyncio.sleep(5)  # Poll every 5 seconds
+                remaining = JOB_POLL_INTERVAL - (loop.time() - started)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
 
             except asyncio.CancelledError:
                 break
@@ -148,6 +284,38 @@ class JobRunner:
                 logger.error("job_poll_error", error=str(e))
                 await asyncio.sleep(10)
 
+    def _dispatch_transcode(self, job: dict) -> None:
+        """Run a transcode job in its own task, without waiting for it."""
+        self._dispatched_job_ids.add(job["job_id"])
+        task = asyncio.create_task(self._run_transcode(job))
+        self._transcode_tasks.add(task)
+        task.add_done_callback(self._transcode_tasks.discard)
+
+    async def _run_transcode(self, job: dict) -> None:
+        """Execute a transcode job once a worker slot is free."""
+        try:
+            async with self._transcode_sem:
+                await self._execute_job(job)
+        finally:
+            self._dispatched_job_ids.discard(job["job_id"])
+
+    def _run_in_background(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a coroutine in a task that stop() waits for."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_bg_task_done)
+
+    def _on_bg_task_done(self, task: asyncio.Task) -> None:
+        """Forget a finished background task, logging any error it raised."""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning("background_task_failed", error=str(task.exception()))
+
+    def _awaiting_preview(self, job: dict) -> bool:
+        """Check whether a rip job's disc is still waiting for preview approval."""
+        disc = self._disc_cache.get(job.get("disc_id"))
+        return bool(disc) and disc.get("preview_status", "pending") == "pending"
+
     async def _execute_job(self, job: dict) -> None:
         """Execute a single job."""
         job_id = job["job_id"]
@@ -190,8 +358,10 @@ class JobRunner:
         try:
             logger.info("starting_rip", job_id=job_id, title_index=title_index)
 
-            # Get the disc info to find the drive
-            disc = await self.server_client.get_disc(disc_id)
+            # Get the disc info to find the drive (usually sent with the poll)
+            disc = self._disc_cache.get(disc_id) or await self.server_client.get_disc(
+                disc_id
+            )
             if not disc:
                 raise RuntimeError(f"Disc not found: {disc_id}")
 
@@ -204,8 +374,8 @@ class JobRunner:
                     disc_id=disc_id,
                     preview_status=preview_status,
                 )
-                # Don't fail the job, just return and let it be retried on next poll
-                # Reset status back to assigned so it will be picked up again
+                # Only reached when the server didn't send the disc with the
+                # poll. Don't fail the job; reset it so it's picked up again
                 await self.server_client.update_job_status(job_id, "assigned", progress=0)
                 return
             elif preview_status == "rejected":
@@ -217,32 +387,27 @@ class JobRunner:
 
             # Create output directory
             output_dir = Path(self.settings.makemkv.temp_dir)
-            output_dir.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
+
+            # Progress callback - MakeMKV reports many times a second, so
+            # updates are coalesced before they reach the server
+            throttler = ProgressThrottler(self.server_client, job_id)
 
-            # Progress callback
             async def on_progress(progress: float):
-                await self.server_client.update_job_status(job_id, "running", progress=progress)
+                throttler.submit(progress)
 
             # Run MakeMKV
-            output_file = await self.makemkv.rip_title(
-                drive=drive,
-                title_index=title_index,
-                output_dir=output_dir,
-                progress_callback=on_progress,
-            )
-
-            logger.info("rip_completed", job_id=job_id, makemkv_output=str(output_file))
-
-            # Rename the file to match our desired output_name
-            # MakeMKV creates its own filename (e.g., G2_t05.mkv), we need to rename it
-            desired_filename = f"{output_name}.mkv"
-            desired_path = output_dir / desired_filename
-
-            if output_file != desired_path:
-                logger.info("renaming_output", from_file=str(output_file), to_file=str(desired_path))
-                output_file.rename(desired_path)
-                output_file = desired_path
-                logger.info("file_renamed", final_path=str(output_file))
+            throttler.start()
+            try:
+                output_file = await self.makemkv.rip_title(
+                    drive=drive,
+                    title_index=title_index,
+                    output_dir=output_dir,
+                    progress_callback=on_progress,
+                    output_basename=output_name,
+                )
+            finally:
+                await throttler.stop()
 
             logger.info("rip_finalized", job_id=job_id, output_file=str(output_file))
             # Update job with output file path
@@ -250,74 +415,119 @@ class JobRunner:
                 job_id, "completed", progress=100, output_file=str(output_file)
             )
 
-            # Stage 2: Extract thumbnails from ripped MKV for visual verification
-            thumbnails = None
-            thumbnail_timestamps = None
-            if self.settings.thumbnails.enabled and self.thumbnail_extractor.is_available():
-                logger.info("extracting_post_rip_thumbnails", file=str(output_file))
-                try:
-                    thumb_result = await self.thumbnail_extractor.extract_from_mkv(
-                        output_file,
-                        title_index=title_index,
-                    )
-                    if thumb_result.thumbnails:
-                        thumbnails = thumb_result.thumbnails
-                        thumbnail_timestamps = thumb_result.timestamps
-                        logger.info(
-                            "post_rip_thumbnails_extracted",
-                            count=len(thumbnails),
-                            timestamps=thumbnail_timestamps,
-                        )
-                    else:
-                        logger.warning(
-                            "post_rip_thumbnail_extraction_failed",
-                            errors=thumb_result.errors,
-                        )
-                except Exception as e:
-                    logger.warning("post_rip_thumbnail_error", error=str(e))
-            else:
-                logger.debug("post_rip_thumbnails_skipped", reason="disabled or ffmpeg unavailable")
-
-            # Queue transcode job for user approval (no auto-assignment)
-            logger.info("queuing_transcode_for_approval", input_file=str(output_file))
-
-            # Get file size for display in dashboard
-            import os
-            file_size = os.path.getsize(output_file) if output_file.exists() else None
-
-            transcode_job = await self.server_client.create_transcode_job(
-                input_file=str(output_file),
-                output_name=output_name,
-                preset=None,  # User will select via dashboard
-                requires_approval=True,
-                source_disc_name=disc.get("disc_name", output_name),
-                input_file_size=file_size,
-                thumbnails=thumbnails,
-                thumbnail_timestamps=thumbnail_timestamps,
+            # A18: Check if all rip jobs for this disc are complete. This only
+            # needs the server, so it runs while thumbnails are extracted from
+            # the ripped file
+            complete_task = asyncio.create_task(
+                self._check_and_notify_disc_complete(disc_id, drive, job_id)
             )
-            if transcode_job:
-                logger.info("transcode_job_queued_for_approval", job_id=transcode_job.get("job_id"))
 
-            # A18: Check if all rip jobs for this disc are complete
-            await self._check_and_notify_disc_complete(disc_id, drive)
+            try:
+                # Stage 2: Extract thumbnails from ripped MKV for visual verification
+                thumbnails = None
+                thumbnail_timestamps = None
+                if self.settings.thumbnails.enabled and self.thumbnail_extractor.is_available():
+                    logger.info("extracting_post_rip_thumbnails", file=str(output_file))
+                    try:
+                        thumb_result = await self.thumbnail_extractor.extract_from_mkv(
+                            output_file,
+                            title_index=title_index,
+                        )
+                        if thumb_result.thumbnails:
+                            thumbnails = thumb_result.thumbnails
+                            thumbnail_timestamps = thumb_result.timestamps
+                            logger.info(
+                                "post_rip_thumbnails_extracted",
+                                count=len(thumbnails),
+                                timestamps=thumbnail_timestamps,
+                            )
+                        else:
+                            logger.warning(
+                                "post_rip_thumbnail_extraction_failed",
+                                errors=thumb_result.errors,
+                            )
+                    except Exception as e:
+                        logger.warning("post_rip_thumbnail_error", error=str(e))
+                else:
+                    logger.debug("post_rip_thumbnails_skipped", reason="disabled or ffmpeg unavailable")
+
+                # Queue transcode job for user approval (no auto-assignment)
+                logger.info("queuing_transcode_for_approval", input_file=str(output_file))
+
+                # Get file size for display in dashboard
+                try:
+                    file_size = output_file.stat().st_size
+                except FileNotFoundError:
+                    file_size = None
+
+                transcode_job = await self.server_client.create_transcode_job(
+                    input_file=str(output_file),
+                    output_name=output_name,
+                    preset=None,  # User will select via dashboard
+                    requires_approval=True,
+                    source_disc_name=disc.get("disc_name", output_name),
+                    input_file_size=file_size,
+                    thumbnails=thumbnails,
+                    thumbnail_timestamps=thumbnail_timestamps,
+                )
+                if transcode_job:
+                    logger.info("transcode_job_queued_for_approval", job_id=transcode_job.get("job_id"))
+            finally:
+                # Awaited even if queuing the transcode fails, so the check
+                # (and eject) never outlives the rip lock unawaited
+                await asyncio.gather(complete_task, return_exceptions=True)
 
         finally:
             # Always reset the rip-in-progress flag
             self._rip_in_progress = False
             logger.debug("rip_lock_released", job_id=job_id)
 
+    def _has_queued_rip(self, disc_id: str, exclude_job_id: Optional[str] = None) -> bool:
+        """Check the last poll for an assigned rip of this disc."""
+        return any(
+            job.get("job_type") == "rip"
+            and job.get("disc_id") == disc_id
+            and job.get("job_id") != exclude_job_id
+            and job.get("status") == "assigned"
+            for job in self._polled_jobs
+        )
+
+    async def _run_deferred_disc_checks(self) -> None:
+        """Run deferred disc completion checks no longer waiting on a queued rip.
+
+        Called after each poll. A sibling rip that is still queued will run
+        the check itself when it finishes; one that was cancelled or failed
+        won't, so the server is asked here instead.
+        """
+        for disc_id, drive in list(self._deferred_disc_checks.items()):
+            if self._has_queued_rip(disc_id):
+                continue
+            del self._deferred_disc_checks[disc_id]
+            await self._check_and_notify_disc_complete(disc_id, drive)
+
     async def _check_and_notify_disc_complete(
-        self, disc_id: str, drive: str
+        self, disc_id: str, drive: str, job_id: Optional[str] = None
     ) -> None:
         """A18: Check if all rips for a disc are complete and notify callback.
 
         Args:
             disc_id: Disc identifier
             drive: Drive letter where disc is mounted
+            job_id: Rip job that just finished, if any
         """
         if not self.on_disc_rips_complete:
             return
 
+        # Another rip of this disc was queued for us at the last poll, so the
+        # disc probably isn't complete yet. That list may be stale (the rip may
+        # since have been cancelled), so decide again after the next poll
+        if self._has_queued_rip(disc_id, exclude_job_id=job_id):
+            logger.debug("disc_rips_still_queued", disc_id=disc_id)
+            self._deferred_disc_checks[disc_id] = drive
+            return
+        # This check covers any deferred one for the disc
+        self._deferred_disc_checks.pop(disc_id, None)
+
         try:
             all_complete = await self.server_client.check_disc_rips_complete(disc_id)
             if all_complete:
@@ -408,7 +618,7 @@ class JobRunner:
 
         # Create output directory
         output_dir = Path(self.settings.worker.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
 
         output_file = output_dir / f"{output_name}.mkv"
 
@@ -420,51 +630,59 @@ class JobRunner:
             preset=preset,
         )
 
-        # Derive gpu_type from config flags
-        gpu_type = "cpu"
-        if self.settings.worker.nvenc:
-            gpu_type = "nvenc"
-        elif self.settings.worker.qsv:
-            gpu_type = "qsv"
-
         # Create transcode job for worker
         transcode_job = TranscodeJob(
             job_id=job_id,
             input_file=input_file,
             output_file=output_file,
             preset=preset,
-            gpu_type=gpu_type,
+            gpu_type=self._gpu_type,
         )
 
         # Submit to worker and wait for completion
         await self.worker.submit_job(transcode_job)
 
-        # Poll for completion with cancellation check
-        cancellation_check_interval = 0
+        # Report to the server when the worker signals a change, checking
+        # for cancellation in between
+        loop = asyncio.get_running_loop()
+        next_cancel_check = loop.time() + TRANSCODE_CANCEL_CHECK_INTERVAL
+        reported: Optional[tuple[str, int]] = None
         while True:
             status = self.worker.get_job_status(job_id)
             if not status:
                 break
 
-            # W9: Check for cancellation every 10 seconds (every 5th iteration)
-            cancellation_check_interval += 1
-            if cancellation_check_interval >= 5:
-                cancellation_check_interval = 0
-                if await self.server_client.is_job_cancelled(job_id):
-                    logger.info("job_cancelled_by_server", job_id=job_id)
-                    await self.worker.cancel_job(job_id)
-                    # Wait briefly for cancellation to complete
-                    await asyncio.sleep(1)
-                    break
-
-            await self.server_client.update_job_status(
-                job_id, status.status, progress=status.progress
-            )
+            # Only send status changes and whole-percent progress steps
+            cancelled = False
+            current = (status.status, int(status.progress))
+            if current != reported:
+                server_job = await self.server_client.update_job_status(
+                    job_id, status.status, progress=status.progress
+                )
+                reported = current
+                if server_job:
+                    # The reply carries the server's status, cancellation included
+                    cancelled = server_job.get("status") == "cancelled"
+                    next_cancel_check = loop.time() + TRANSCODE_CANCEL_CHECK_INTERVAL
 
             if status.status in ("completed", "failed", "cancelled"):
                 break
 
-            await asyncio.sleep(2)
+            # W9: Ask the server directly if nothing has been sent for 10 seconds
+            if not cancelled and loop.time() >= next_cancel_check:
+                next_cancel_check = loop.time() + TRANSCODE_CANCEL_CHECK_INTERVAL
+                cancelled = await self.server_client.is_job_cancelled(job_id)
+
+            if cancelled:
+                logger.info("job_cancelled_by_server", job_id=job_id)
+                await self.worker.cancel_job(job_id)
+                # Wait briefly for cancellation to complete
+                await asyncio.sleep(1)
+                break
+
+            await self.worker.wait_status_change(
+                job_id, timeout=max(0.0, next_cancel_check - loop.time())
+            )
 
         # Get final status
         final_status = self.worker.get_job_status(job_id)
@@ -485,8 +703,11 @@ class JobRunner:
                     job_id, "completed", progress=100, output_file=str(output_file)
                 )
 
-                # A17: Cleanup staging files after successful upload
-                await self._cleanup_staging_files(input_file, output_file)
+                # A17: Cleanup staging files after successful upload, without
+                # holding up the job
+                self._run_in_background(
+                    self._cleanup_staging_files(input_file, output_file)
+                )
             else:
                 # Mark as completed but with upload error note
                 await self.server_client.update_job_status(
@@ -539,7 +760,7 @@ class JobRunner:
         if self.settings.makemkv.cleanup_after_transcode:
             if input_file.exists():
                 try:
-                    input_file.unlink()
+                    await asyncio.to_thread(input_file.unlink)
                     logger.info(
                         "staging_file_deleted",
                         file=str(input_file),
@@ -562,7 +783,7 @@ class JobRunner:
         if self.settings.worker.cleanup_after_upload:
             if output_file.exists():
                 try:
-                    output_file.unlink()
+                    await asyncio.to_thread(output_file.unlink)
                     logger.info(
                         "staging_file_deleted",
                         file=str(output_file),
@@ -194,6 +194,7 @@ class MakeMKVService:
         title_index: int,
         output_dir: Optional[Path] = None,
         progress_callback: Optional[callable] = None,
+        output_basename: Optional[str] = None,
     ) -> Path:
         """Rip a specific title from the disc.
 
@@ -202,6 +203,9 @@ class MakeMKVService:
             title_index: Index of the title to rip
             output_dir: Directory for output file (uses temp_dir if not specified)
             progress_callback: Optional callback for progress updates
+            output_basename: File name (without .mkv) for the ripped file.
+                             MakeMKV picks its own name (e.g. G2_t05.mkv), so
+                             the file is renamed to this once the rip exits.
 
         Returns:
             Path to the ripped MKV file
@@ -317,6 +321,17 @@ class MakeMKVService:
 
         # Return the most recently modified MKV
         output_file = max(mkv_files, key=lambda p: p.stat().st_mtime)
+
+        if output_basename:
+            desired_path = output_dir / f"{output_basename}.mkv"
+            if output_file != desired_path:
+                logger.debug(
+                    "renaming_output", from_file=str(output_file), to_file=str(desired_path)
+                )
+                # Off the event loop: NTFS can stall a rename of a large file
+                await asyncio.to_thread(output_file.rename, desired_path)
+                output_file = desired_path
+
         logger.info("rip_completed", output_file=str(output_file))
 
         return output_file
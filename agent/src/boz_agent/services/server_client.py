@@ -1,6 +1,9 @@
 """HTTP client for communicating with the Boz Ripper server."""
 
 import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Optional
 from uuid import uuid4
 
@@ -12,6 +15,28 @@ from boz_agent.services.vlc_detector import VLCInfo
 
 logger = structlog.get_logger()
 
+# Bytes read from disk per chunk when streaming a file upload
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+async def _multipart_file_stream(
+    file_path: Path, head: bytes, tail: bytes
+) -> AsyncIterator[bytes]:
+    """Yield a multipart body, reading the file in a worker thread."""
+    yield head
+    with open(file_path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE):
+            yield chunk
+    yield tail
+
+
+@dataclass
+class AgentPollResult:
+    """Jobs assigned to this agent, plus the discs their rip jobs refer to."""
+
+    jobs: list[dict] = field(default_factory=list)
+    discs: dict[str, dict] = field(default_factory=dict)
+
 
 class ServerClient:
     """Client for the Boz Ripper server REST API."""
@@ -29,6 +54,11 @@ class ServerClient:
                 base_url=self.config.url,
                 timeout=self.config.timeout,
                 headers=self._get_headers(),
+                # Keep idle connections for the 30 s heartbeat and job
+                # long-poll; the server keeps them open for 75 s
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, keepalive_expiry=60
+                ),
             )
         return self._client
 
@@ -189,23 +219,49 @@ class ServerClient:
         except Exception as e:
             logger.warning("disc_ejection_report_failed", error=str(e))
 
-    async def get_pending_jobs(self) -> list[dict]:
+    async def get_pending_jobs(self, wait: float = 0) -> list[dict]:
         """Get pending jobs for this agent.
 
+        Args:
+            wait: Seconds the server may hold the request open waiting for a
+                job to be assigned (long-poll); 0 returns immediately
+
         Returns:
             List of job dictionaries
         """
+        return (await self.poll_agent_state(wait)).jobs
+
+    async def poll_agent_state(self, wait: float = 0) -> AgentPollResult:
+        """Get pending jobs together with the discs their rip jobs need.
+
+        Args:
+            wait: Seconds the server may hold the request open waiting for a
+                job to be assigned (long-poll); 0 returns immediately
+
+        Returns:
+            Jobs and a disc_id -> disc info mapping (empty on failure)
+        """
         if not self._agent_id:
-            return []
+            return AgentPollResult()
 
         try:
             client = await self._get_client()
-            response = await client.get(f"/api/agents/{self._agent_id}/jobs")
+            if wait:
+                response = await client.get(
+                    f"/api/agents/{self._agent_id}/jobs",
+                    params={"wait": wait},
+                    timeout=self.config.timeout + wait,
+                )
+            else:
+                response = await client.get(f"/api/agents/{self._agent_id}/jobs")
             response.raise_for_status()
-            return response.json().get("jobs", [])
+            data = response.json()
+            return AgentPollResult(
+                jobs=data.get("jobs", []), discs=data.get("discs", {})
+            )
         except Exception as e:
             logger.warning("get_jobs_failed", error=str(e))
-            return []
+            return AgentPollResult()
 
     async def update_job_status(
         self,
@@ -214,7 +270,7 @@ class ServerClient:
         progress: Optional[float] = None,
         error: Optional[str] = None,
         output_file: Optional[str] = None,
-    ) -> None:
+    ) -> Optional[dict]:
         """Update the status of a job.
 
         Args:
@@ -223,6 +279,10 @@ class ServerClient:
             progress: Progress percentage (0-100)
             error: Error message if failed
             output_file: Path to output file (if completed)
+
+        Returns:
+            The job as the server now has it, or None if the update failed.
+            A job cancelled on the server comes back with status 'cancelled'.
         """
         payload = {
             "status": status,
@@ -233,10 +293,12 @@ class ServerClient:
 
         try:
             client = await self._get_client()
-            await client.patch(f"/api/jobs/{job_id}", json=payload)
+            response = await client.patch(f"/api/jobs/{job_id}", json=payload)
             logger.debug("job_status_updated", job_id=job_id, status=status)
+            return response.json() if response.is_success else None
         except Exception as e:
             logger.warning("job_status_update_failed", error=str(e))
+            return None
 
     async def get_disc(self, disc_id: str) -> Optional[dict]:
         """Get disc information by ID.
@@ -350,34 +412,47 @@ class ServerClient:
         Returns:
             True if successful
         """
-        from pathlib import Path
         file_path = Path(file_path)
 
-        if not file_path.exists():
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
             logger.error("upload_file_not_found", path=str(file_path))
             return False
 
+        # Build the multipart body by hand so the file can be streamed in
+        # large chunks read off the event loop, with a known Content-Length
+        boundary = uuid4().hex
+        filename = file_path.name.replace('"', "%22")
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="name"\r\n\r\n'
+            f"{name}\r\n"
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+
+        headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(head) + file_size + len(tail)),
+        }
+        if self.config.api_key:
+            headers["Authorization"] = f"Bearer {self.config.api_key}"
+
         try:
             # Use a separate client for file uploads with longer timeout
             async with httpx.AsyncClient(
                 base_url=self.config.url,
                 timeout=3600,  # 1 hour timeout for large files
             ) as client:
-                with open(file_path, "rb") as f:
-                    files = {"file": (file_path.name, f, "application/octet-stream")}
-                    data = {"name": name}
-
-                    headers = {}
-                    if self.config.api_key:
-                        headers["Authorization"] = f"Bearer {self.config.api_key}"
-
-                    response = await client.post(
-                        "/api/files/upload",
-                        files=files,
-                        data=data,
-                        headers=headers,
-                    )
-                    response.raise_for_status()
+                response = await client.post(
+                    "/api/files/upload",
+                    content=_multipart_file_stream(file_path, head, tail),
+                    headers=headers,
+                )
+                response.raise_for_status()
 
             logger.info("file_uploaded", path=str(file_path), name=name)
             return True
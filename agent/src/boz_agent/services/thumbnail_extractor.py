@@ -46,9 +46,19 @@ class ThumbnailExtractor:
         self.config = config
         self._ffmpeg = config.ffmpeg_path
         self._temp_dir = Path(tempfile.gettempdir()) / "boz_thumbnails"
+        self._available: Optional[bool] = None
 
     def is_available(self) -> bool:
-        """Check if FFmpeg is installed and accessible."""
+        """Check if FFmpeg is installed and accessible.
+
+        FFmpeg is probed once; the result is reused for the agent's lifetime.
+        """
+        if self._available is None:
+            self._available = self._probe_ffmpeg()
+        return self._available
+
+    def _probe_ffmpeg(self) -> bool:
+        """Run ``ffmpeg -version`` to see whether FFmpeg works."""
         try:
             result = subprocess.run(
                 [self._ffmpeg, "-version"],
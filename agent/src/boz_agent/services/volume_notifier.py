@@ -0,0 +1,206 @@
+"""Windows volume change notifications (WM_DEVICECHANGE)."""
+
+import ctypes
+import threading
+from ctypes import wintypes
+from typing import Callable, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+WM_DEVICECHANGE = 0x0219
+WM_CLOSE = 0x0010
+WM_DESTROY = 0x0002
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+DBT_DEVTYP_VOLUME = 0x00000002
+
+LRESULT = ctypes.c_ssize_t
+WNDPROC = ctypes.WINFUNCTYPE(
+    LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+)
+
+
+class WNDCLASSW(ctypes.Structure):
+    _fields_ = [
+        ("style", wintypes.UINT),
+        ("lpfnWndProc", WNDPROC),
+        ("cbClsExtra", ctypes.c_int),
+        ("cbWndExtra", ctypes.c_int),
+        ("hInstance", wintypes.HINSTANCE),
+        ("hIcon", wintypes.HICON),
+        ("hCursor", wintypes.HANDLE),
+        ("hbrBackground", wintypes.HBRUSH),
+        ("lpszMenuName", wintypes.LPCWSTR),
+        ("lpszClassName", wintypes.LPCWSTR),
+    ]
+
+
+class DEV_BROADCAST_VOLUME(ctypes.Structure):
+    _fields_ = [
+        ("dbcv_size", wintypes.DWORD),
+        ("dbcv_devicetype", wintypes.DWORD),
+        ("dbcv_reserved", wintypes.DWORD),
+        ("dbcv_unitmask", wintypes.DWORD),
+        ("dbcv_flags", wintypes.WORD),
+    ]
+
+
+def _bind_user32():
+    """Bind the user32/kernel32 functions the listener needs."""
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    prototypes = {
+        "RegisterClassW": (wintypes.ATOM, [ctypes.POINTER(WNDCLASSW)]),
+        "UnregisterClassW": (wintypes.BOOL, [wintypes.LPCWSTR, wintypes.HINSTANCE]),
+        "CreateWindowExW": (
+            wintypes.HWND,
+            [
+                wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+            ],
+        ),
+        "DestroyWindow": (wintypes.BOOL, [wintypes.HWND]),
+        "DefWindowProcW": (
+            LRESULT, [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        ),
+        "GetMessageW": (
+            wintypes.BOOL,
+            [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT],
+        ),
+        "TranslateMessage": (wintypes.BOOL, [ctypes.POINTER(wintypes.MSG)]),
+        "DispatchMessageW": (LRESULT, [ctypes.POINTER(wintypes.MSG)]),
+        "PostMessageW": (
+            wintypes.BOOL, [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        ),
+        "PostQuitMessage": (None, [ctypes.c_int]),
+    }
+    for name, (restype, argtypes) in prototypes.items():
+        func = getattr(user32, name)
+        func.restype = restype
+        func.argtypes = argtypes
+
+    kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+    kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+
+    return user32, kernel32
+
+
+class VolumeChangeListener:
+    """Reports drive letters whose media arrives or is removed.
+
+    Windows broadcasts WM_DEVICECHANGE volume events to every top-level
+    window, so a hidden window with its own message loop on a background
+    thread is enough - no RegisterDeviceNotification call is needed.
+    """
+
+    CLASS_NAME = "BozAgentVolumeListener"
+
+    def __init__(self, on_change: Callable[[list[str]], None]):
+        self.on_change = on_change
+        self._thread: Optional[threading.Thread] = None
+        self._hwnd: Optional[int] = None
+        self._ready = threading.Event()
+        # Set by stop(); a window created after that closes itself at once
+        self._stopping = threading.Event()
+        self._error: Optional[str] = None
+        # Keep the callback alive for as long as the window class exists
+        self._wndproc = WNDPROC(self._window_proc)
+        self._user32, self._kernel32 = _bind_user32()
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """Start the listener thread. Returns True once the window exists."""
+        self._thread = threading.Thread(
+            target=self._run, name="volume_listener", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait(timeout)
+
+        if self._hwnd is None:
+            logger.warning("volume_listener_unavailable", error=self._error)
+            return False
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close the hidden window and wait up to timeout for the thread to end.
+
+        Blocks, so call it off the event loop. Safe to call while the window
+        is still being created: it is then closed as soon as it exists.
+        """
+        self._stopping.set()
+        hwnd = self._hwnd
+        if hwnd is not None:
+            self._user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+
+    def _run(self) -> None:
+        """Create the hidden window and pump its messages (listener thread)."""
+        user32 = self._user32
+        h_instance = self._kernel32.GetModuleHandleW(None)
+
+        wndclass = WNDCLASSW()
+        wndclass.lpfnWndProc = self._wndproc
+        wndclass.hInstance = h_instance
+        wndclass.lpszClassName = self.CLASS_NAME
+
+        try:
+            if not user32.RegisterClassW(ctypes.byref(wndclass)):
+                self._error = f"RegisterClassW failed ({ctypes.get_last_error()})"
+                return
+
+            # Top-level but never shown; message-only windows miss broadcasts
+            hwnd = user32.CreateWindowExW(
+                0, self.CLASS_NAME, self.CLASS_NAME, 0,
+                0, 0, 0, 0, None, None, h_instance, None,
+            )
+            if not hwnd:
+                self._error = f"CreateWindowExW failed ({ctypes.get_last_error()})"
+                user32.UnregisterClassW(self.CLASS_NAME, h_instance)
+                return
+            self._hwnd = hwnd
+            if self._stopping.is_set():
+                # stop() ran before the window existed
+                user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
+        finally:
+            self._ready.set()
+
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+        self._hwnd = None
+        user32.UnregisterClassW(self.CLASS_NAME, h_instance)
+
+    def _window_proc(self, hwnd, msg, wparam, lparam):
+        """Window procedure for the hidden listener window."""
+        if msg == WM_DEVICECHANGE:
+            if wparam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE) and lparam:
+                volume = DEV_BROADCAST_VOLUME.from_address(lparam)
+                if volume.dbcv_devicetype == DBT_DEVTYP_VOLUME:
+                    self._report(volume.dbcv_unitmask)
+            return 1
+
+        if msg == WM_CLOSE:
+            self._user32.DestroyWindow(hwnd)
+            return 0
+
+        if msg == WM_DESTROY:
+            self._user32.PostQuitMessage(0)
+            return 0
+
+        return self._user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+    def _report(self, unit_mask: int) -> None:
+        """Translate a unit mask into drive letters and hand them on."""
+        drives = [f"{chr(ord('A') + i)}:" for i in range(26) if unit_mask >> i & 1]
+        try:
+            self.on_change(drives)
+        except Exception as e:
+            logger.error("volume_listener_callback_error", error=str(e))
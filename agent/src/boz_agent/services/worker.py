@@ -1,7 +1,7 @@
 """Local transcoding worker service."""
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +26,10 @@ class TranscodeJob:
     error: Optional[str] = None
     process: Optional[asyncio.subprocess.Process] = None
     cancelled: bool = False
+    # Set when status changes or progress passes a whole percent
+    status_changed: asyncio.Event = field(
+        default_factory=asyncio.Event, repr=False, compare=False
+    )
 
 
 class WorkerService:
@@ -100,6 +104,31 @@ class WorkerService:
         """Get the status of a job."""
         return self._current_jobs.get(job_id)
 
+    async def wait_status_change(
+        self, job_id: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Wait for a job's status or whole-percent progress to change.
+
+        Args:
+            job_id: Job ID to watch
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the job changed, False on timeout or unknown job
+        """
+        job = self._current_jobs.get(job_id)
+        if not job:
+            return False
+
+        try:
+            async with asyncio.timeout(timeout):
+                await job.status_changed.wait()
+        except TimeoutError:
+            return False
+
+        job.status_changed.clear()
+        return True
+
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job.
 
@@ -141,6 +170,7 @@ class WorkerService:
                 logger.warning("failed_to_delete_partial_output", job_id=job_id, error=str(e))
 
         job.status = "cancelled"
+        job.status_changed.set()
         logger.info("job_cancelled", job_id=job_id)
         return True
 
@@ -175,6 +205,7 @@ class WorkerService:
         )
 
         job.status = "running"
+        job.status_changed.set()
 
         try:
             # Check if already cancelled before starting
@@ -209,7 +240,10 @@ class WorkerService:
                 line_str = line.decode("utf-8", errors="replace").strip()
                 progress = self._parse_progress(line_str)
                 if progress is not None:
+                    advanced = int(progress) > int(job.progress)
                     job.progress = progress
+                    if advanced:
+                        job.status_changed.set()
 
             await process.wait()
 
@@ -244,6 +278,10 @@ class WorkerService:
             job.error = str(e)
             logger.error("job_error", job_id=job.job_id, error=str(e))
 
+        finally:
+            # Final status (completed, failed or cancelled) is now set
+            job.status_changed.set()
+
     def _build_handbrake_command(self, job: TranscodeJob) -> list[str]:
         """Build the HandBrake CLI command."""
         cmd = [
@@ -1,7 +1,10 @@
 """Tests for configuration loading."""
 
+import os
+
 import pytest
 
+from boz_agent.core import config
 from boz_agent.core.config import Settings
 
 
@@ -24,3 +27,49 @@ def test_settings_from_env(monkeypatch):
 
     assert settings.server.url == "http://custom:9000"
     assert settings.agent.name == "Test Agent"
+
+
+def test_from_yaml_reuses_unchanged_file(tmp_path, monkeypatch):
+    """Test that an unchanged YAML file is only parsed once."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("agent:\n  name: Cached Agent\n")
+
+    reads = []
+    read_yaml = config._read_yaml
+    monkeypatch.setattr(
+        config, "_read_yaml", lambda path: reads.append(path) or read_yaml(path)
+    )
+
+    first = Settings.from_yaml(config_file)
+    second = Settings.from_yaml(config_file)
+
+    assert len(reads) == 1
+    assert first is not second
+    assert first.agent.name == second.agent.name == "Cached Agent"
+
+
+def test_from_yaml_applies_current_env(tmp_path, monkeypatch):
+    """Test that env overrides are applied even when the file is cached."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("agent:\n  name: Cached Agent\n")
+    Settings.from_yaml(config_file)
+
+    monkeypatch.setenv("BOZ_SERVER__URL", "http://custom:9000")
+
+    assert Settings.from_yaml(config_file).server.url == "http://custom:9000"
+
+
+def test_from_yaml_reloads_modified_file(tmp_path):
+    """Test that a modified YAML file is parsed again."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("agent:\n  name: Old Name\n")
+    first = Settings.from_yaml(config_file)
+
+    config_file.write_text("agent:\n  name: New Name\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = Settings.from_yaml(config_file)
+
+    assert second is not first
+    assert second.agent.name == "New Name"
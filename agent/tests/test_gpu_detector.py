@@ -0,0 +1,46 @@
+"""Tests for GPU detection."""
+
+import dataclasses
+
+import pytest
+
+from boz_agent.services.gpu_detector import (
+    GPUInfo,
+    _nvenc_capabilities,
+    get_handbrake_encoder,
+)
+
+
+@pytest.mark.parametrize(
+    "gpu_name, expected",
+    [
+        ("NVIDIA GeForce RTX 4090", (9, True, True)),
+        ("NVIDIA GeForce RTX 3060 Ti", (8, True, False)),
+        ("NVIDIA GeForce RTX 2070 SUPER", (7, True, False)),
+        ("NVIDIA GeForce GTX 1660 Ti", (7, True, False)),
+        ("NVIDIA GeForce GTX 1080", (6, True, False)),
+        ("NVIDIA GeForce GTX 970", (5, False, False)),
+        ("Quadro P2000", (0, False, False)),
+    ],
+)
+def test_nvenc_capabilities(gpu_name, expected):
+    """Test the newest matching NVENC generation wins, not the leftmost match."""
+    assert _nvenc_capabilities(gpu_name) == expected
+
+
+def test_handbrake_encoder_selection():
+    """Test encoder lookup falls back to H.264 for codecs the GPU lacks."""
+    gpu = GPUInfo(name="RTX 3060", vendor="nvidia", nvenc=True, hevc=True)
+
+    assert get_handbrake_encoder(gpu, "HEVC") == "nvenc_h265"
+    assert get_handbrake_encoder(gpu, "av1") == "nvenc_h264"
+    assert get_handbrake_encoder(None, "av1") == "svt_av1"
+
+
+def test_gpu_info_is_immutable():
+    """Test cached GPUInfo objects can't be changed out from under the encoder map."""
+    gpu = GPUInfo(name="RTX 3060", vendor="nvidia", nvenc=True, hevc=True)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        gpu.hevc = False
+    assert dataclasses.replace(gpu, hevc=False).encoders["h265"] == "nvenc_h264"
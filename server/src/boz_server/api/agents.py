@@ -1,9 +1,10 @@
 """Agent management API endpoints."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from boz_server.api.deps import AgentManagerDep, ApiKeyDep, JobQueueDep
 from boz_server.models.agent import Agent, AgentRegistration
+from boz_server.models.job import JobStatus, JobType
 
 router = APIRouter(prefix="/api/agents", tags=["agents"])
 
@@ -73,11 +74,35 @@ async def get_agent_jobs(
     agent_manager: AgentManagerDep,
     job_queue: JobQueueDep,
     _: ApiKeyDep,
+    wait: float = Query(0, ge=0, le=60),
 ) -> dict:
-    """Get jobs assigned to an agent."""
+    """Get jobs assigned to an agent.
+
+    With ``wait`` set, this is a long-poll: if nothing the agent can start is
+    assigned yet, the response is held for up to that many seconds until a
+    job is assigned or a preview decision unblocks a rip.
+    """
     agent = await agent_manager.get(agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    jobs = await job_queue.get_jobs_for_agent(agent_id)
-    return {"jobs": [j.model_dump() for j in jobs]}
+    if wait:
+        jobs = await job_queue.wait_for_agent_jobs(agent_id, wait)
+    else:
+        jobs = await job_queue.get_jobs_for_agent(agent_id)
+
+    # Include the discs that assigned rip jobs need, saving the agent a
+    # GET /api/discs/{disc_id} round trip per rip
+    discs = {}
+    for job in jobs:
+        if (
+            job.job_type == JobType.RIP
+            and job.status == JobStatus.ASSIGNED
+            and job.disc_id
+            and job.disc_id not in discs
+        ):
+            disc = await job_queue.get_disc(job.disc_id)
+            if disc:
+                discs[job.disc_id] = disc.model_dump()
+
+    return {"jobs": [j.model_dump() for j in jobs], "discs": discs}
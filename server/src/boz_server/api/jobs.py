@@ -141,6 +141,10 @@ async def update_job(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
+    # Update refused (job was cancelled) - return it so the agent can stop
+    if job.status != update.status:
+        return job
+
     # If job completed or failed, release the agent and cleanup thumbnails
     if update.status in (JobStatus.COMPLETED, JobStatus.FAILED):
         if job.assigned_agent_id:
@@ -193,4 +193,7 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # Outlive the agents' 60 s client keep-alive so idle connections
+        # are reused rather than reopened for each heartbeat
+        timeout_keep_alive=75,
     )
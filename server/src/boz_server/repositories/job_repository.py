@@ -200,6 +200,14 @@ class JobRepository(BaseRepository[JobORM]):
         if not job_orm:
             return None
 
+        # A cancelled job stays cancelled: a late progress update from the
+        # agent must not bring it back. The caller sees the cancelled job.
+        if (
+            job_orm.status == JobStatus.CANCELLED.value
+            and status != JobStatus.CANCELLED
+        ):
+            return self.to_pydantic(job_orm)
+
         job_orm.status = status.value
         if progress is not None:
             job_orm.progress = progress
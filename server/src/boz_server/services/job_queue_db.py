@@ -21,7 +21,10 @@ class JobQueue:
 
     def __init__(self):
         """Initialize job queue."""
-        pass
+        # Per-agent signal set whenever a job is assigned to that agent or a
+        # preview decision unblocks one of its rips, so long-polling agents
+        # can be answered straight away
+        self._agent_job_signals: dict[str, asyncio.Event] = {}
 
     async def _get_session(self) -> AsyncSession:
         """Get a new database session."""
@@ -78,6 +81,10 @@ class JobQueue:
             updated_disc = await repo.update_from_pydantic(disc)
             await session.commit()
 
+            # An approved or rejected preview unblocks the disc's rip jobs
+            if disc.preview_status != PreviewStatus.PENDING:
+                self._notify_agent(disc.agent_id)
+
             if updated_disc:
                 return updated_disc
 
@@ -179,6 +186,45 @@ class JobQueue:
             repo = JobRepository(session)
             return await repo.get_jobs_for_agent(agent_id)
 
+    async def wait_for_agent_jobs(self, agent_id: str, timeout: float) -> list[Job]:
+        """Get jobs for an agent, waiting up to timeout seconds for an assignment.
+
+        Returns at once if the agent already has an assigned job it can start.
+        Rip jobs whose disc preview is still pending don't count; approving or
+        rejecting the preview wakes the wait instead.
+        """
+        signal = self._agent_job_signals.setdefault(agent_id, asyncio.Event())
+        # Cleared before the query so an assignment made after it still wakes us
+        signal.clear()
+
+        jobs = await self.get_jobs_for_agent(agent_id)
+        if await self._has_startable_job(jobs):
+            return jobs
+
+        try:
+            await asyncio.wait_for(signal.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return jobs
+        return await self.get_jobs_for_agent(agent_id)
+
+    async def _has_startable_job(self, jobs: list[Job]) -> bool:
+        """Check for an assigned job that isn't waiting on a preview decision."""
+        for job in jobs:
+            if job.status != JobStatus.ASSIGNED:
+                continue
+            if job.job_type == JobType.RIP and job.disc_id:
+                disc = await self.get_disc(job.disc_id)
+                if disc and disc.preview_status == PreviewStatus.PENDING:
+                    continue
+            return True
+        return False
+
+    def _notify_agent(self, agent_id: Optional[str]) -> None:
+        """Wake any long-poll waiting on jobs for this agent."""
+        signal = self._agent_job_signals.get(agent_id) if agent_id else None
+        if signal:
+            signal.set()
+
     async def assign_job(self, job_id: str, agent_id: str) -> bool:
         """Assign a job to an agent."""
         async with await self._get_session() as session:
@@ -187,6 +233,7 @@ class JobQueue:
             if job:
                 await session.commit()
                 logger.info(f"Job {job_id} assigned to {agent_id}")
+                self._notify_agent(agent_id)
                 return True
             return False
 
@@ -259,6 +306,7 @@ class JobQueue:
                 await session.commit()
                 rename_note = f", renamed to '{output_name}'" if output_name else ""
                 logger.info(f"Job {job_id} approved: agent={agent_id}, preset={preset}{rename_note}")
+                self._notify_agent(agent_id)
             return job
 
     async def update_job_thumbnails(